@@ -0,0 +1,52 @@
+"""
+benchmarks/bar_aggregator_benchmark.py
+This script measures the tick throughput of the BarAggregatorManager.
+
+Run it from the project root with: PYTHONPATH=src python benchmarks/bar_aggregator_benchmark.py
+"""
+
+import argparse
+import time as timer
+from datetime import datetime, time, timezone
+
+import numpy as np
+
+from infrastructure.bar_aggregator_manager import BarAggregatorManager
+
+
+def main() -> None:
+    """
+    Feed seeded random ticks spanning a daylight saving time change and print ticks/s.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    generator = np.random.default_rng(arguments.seed)
+    start = datetime(2025, 10, 30, tzinfo=timezone.utc).timestamp()
+    timestamps = start + np.cumsum(generator.exponential(0.5, arguments.ticks))
+    prices = 1.1 + np.cumsum(generator.normal(0, 1e-5, arguments.ticks))
+    volumes = generator.integers(1, 10, arguments.ticks).astype(float)
+
+    aggregator = BarAggregatorManager(
+        ("1m", "5m", "15m", "1h", "4h", "1d"),
+        timezone_name="America/New_York",
+        session_start=time(17, 0),
+    )
+    ticks = zip(timestamps.tolist(), prices.tolist(), volumes.tolist())
+
+    started = timer.perf_counter()
+    for timestamp, price, volume in ticks:
+        aggregator.update_tick(timestamp, price, volume)
+    aggregator.flush()
+    elapsed = timer.perf_counter() - started
+
+    print(
+        f"{arguments.ticks} ticks over {(timestamps[-1] - start) / 86400:.1f} days, "
+        f"6 timeframes: {elapsed:.2f} s, {arguments.ticks / elapsed:,.0f} ticks/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+benchmarks/economic_calendar_benchmark.py
+This script measures the parsing and bar alignment of multi-year economic calendar histories.
+
+Run it from the project root with: PYTHONPATH=src python benchmarks/economic_calendar_benchmark.py
+"""
+
+import argparse
+import time as timer
+
+import numpy as np
+from pandas import DataFrame, date_range
+
+from infrastructure.economic_calendar_feature_manager import (
+    EconomicCalendarFeatureManager,
+)
+
+
+def make_calendar(years: int, events_per_day: int, seed: int) -> DataFrame:
+    """
+    Build a seeded synthetic calendar shaped like investpy's output.
+
+    Args:
+        years (int): The number of years of history.
+        events_per_day (int): The number of events per day.
+        seed (int): The random seed.
+
+    Returns:
+        DataFrame: The raw calendar events.
+    """
+    generator = np.random.default_rng(seed)
+    days = date_range("2020-01-01", periods=365 * years, freq="D")
+    size = len(days) * events_per_day
+
+    dates = np.repeat(days.strftime("%d/%m/%Y").to_numpy(), events_per_day)
+    minutes = generator.integers(0, 96, size) * 15
+    times = np.char.add(
+        np.char.add(np.char.zfill((minutes // 60).astype(str), 2), ":"),
+        np.char.zfill((minutes % 60).astype(str), 2),
+    ).astype(object)
+    times[generator.random(size) < 0.05] = "All Day"
+
+    value_pool = np.array(
+        [f"{value:.1f}%" for value in np.arange(-2, 6, 0.1)]
+        + [f"{value}K" for value in range(-50, 400, 5)]
+        + [f"{value:.2f}M" for value in np.arange(-1, 3, 0.05)]
+        + ["1,200", "2,450", "-0.3B", ""],
+        dtype=object,
+    )
+    return DataFrame(
+        {
+            "date": dates,
+            "time": times,
+            "currency": generator.choice(["USD", "EUR", "GBP", "JPY", "CHF"], size),
+            "importance": generator.choice(["low", "medium", "high", None], size),
+            "actual": generator.choice(value_pool, size),
+            "forecast": generator.choice(value_pool, size),
+            "previous": generator.choice(value_pool, size),
+        }
+    )
+
+
+def main() -> None:
+    """
+    Parse a synthetic calendar, align it onto 1m bars and print the timings.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--events-per-day", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    events = make_calendar(arguments.years, arguments.events_per_day, arguments.seed)
+    bar_index = date_range(
+        "2020-01-01", periods=365 * arguments.years * 1440, freq="min", tz="UTC"
+    )
+
+    started = timer.perf_counter()
+    manager = EconomicCalendarFeatureManager(events, timezone_name="America/New_York")
+    parsed = timer.perf_counter()
+    features = manager.align_to_bars(bar_index)
+    aligned = timer.perf_counter()
+
+    print(
+        f"{len(events)} events over {arguments.years} years: "
+        f"parse {parsed - started:.2f} s ({len(events) / (parsed - started):,.0f} events/s), "
+        f"align onto {len(bar_index)} 1m bars {aligned - parsed:.2f} s, "
+        f"{int(features['calendar_events'].sum())} events aligned"
+    )
+
+
+if __name__ == "__main__":
+    main()
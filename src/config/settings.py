@@ -4,6 +4,7 @@ This file contains the settings for the bot.
 """
 
 import os
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -31,3 +32,12 @@ class Settings:
             raise ValueError("API_KEY_OPENAI is not set")
 
         return openai_key
+
+    def api_openai_base_url(self) -> Optional[str]:
+        """
+        Get the base URL of the OpenAI compatible API, e.g. a local fake endpoint.
+
+        Returns:
+            Optional[str]: The base URL, or None to use the default OpenAI endpoint.
+        """
+        return os.getenv("API_BASE_URL_OPENAI") or None
@@ -2,12 +2,14 @@
 src/domain/entity/article.py
 
 This module defines the ArticleEntity, which represents an article in the database.
-The entity includes a unique identifier (generated as a UUID), a title, a unique link, and the article content.
+The entity includes a unique identifier (generated as a UUID), a title, a unique link, the article content,
+a short summary generated in the background, and the near-duplicate cluster the article belongs to.
 """
 
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, DateTime, LargeBinary, String, Text
 
 from infrastructure.database_manager import Base
 
@@ -20,7 +22,11 @@ class ArticleEntity(Base):
         id (str): Unique identifier for the article, generated as a UUID.
         title (str): Title of the article.
         link (str): Unique link to the article.
-        content (str): Full content of the article.
+        content (str): Full content of the article, None for near-duplicates of an earlier article.
+        summary (str): Short summary of the content, None until it has been generated.
+        created_at (datetime): Time at which the article was stored.
+        cluster_id (str): Identifier of the near-duplicate cluster, i.e. the id of its first article.
+        minhash (bytes): MinHash signature of the article text.
     """
 
     __tablename__ = "articles"
@@ -35,3 +41,7 @@ class ArticleEntity(Base):
     title = Column(Text, nullable=False)
     link = Column(Text, unique=True, nullable=False)
     content = Column(Text)
+    summary = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True, nullable=False)
+    cluster_id = Column(String(36), index=True)
+    minhash = Column(LargeBinary)
@@ -0,0 +1,30 @@
+"""
+src/domain/entity/article_lsh_band.py
+
+This module defines the ArticleLshBandEntity, which persists the LSH index used to detect near-duplicate articles.
+Each row maps one band of an article's MinHash signature to the hashed bucket it falls into.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+
+from infrastructure.database_manager import Base
+
+
+class ArticleLshBandEntity(Base):
+    """
+    Represents one LSH band bucket of an article in the database.
+
+    Attributes:
+        article_id (str): Identifier of the article the band belongs to.
+        band (int): Index of the band in the MinHash signature.
+        bucket (str): Hexadecimal hash of the band values.
+    """
+
+    __tablename__ = "article_lsh_bands"
+    __table_args__ = (Index("ix_article_lsh_bands_band_bucket", "band", "bucket"),)
+
+    article_id = Column(
+        String(36), ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True
+    )
+    band = Column(Integer, primary_key=True)
+    bucket = Column(String(16), nullable=False)
@@ -0,0 +1,33 @@
+"""
+src/domain/models/bar.py
+This module defines the BarModel, which represents a closed OHLCV bar.
+"""
+
+from datetime import datetime
+from typing import TypedDict
+
+
+class BarModel(TypedDict):
+    """
+    Represents a closed OHLCV bar for a given timeframe.
+
+    The price and volume keys use the same column names as the DataFrames
+    expected by TechnicalIndicatorManager.
+
+    Attributes:
+        timeframe (str): The timeframe of the bar (e.g., '1m', '5m', '1h', '1d').
+        time (datetime): The opening time of the bar, in the session timezone.
+        Open (float): The first price of the bar.
+        High (float): The highest price of the bar.
+        Low (float): The lowest price of the bar.
+        Close (float): The last price of the bar.
+        Volume (float): The traded volume of the bar.
+    """
+
+    timeframe: str
+    time: datetime
+    Open: float
+    High: float
+    Low: float
+    Close: float
+    Volume: float
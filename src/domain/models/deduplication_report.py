@@ -0,0 +1,29 @@
+"""
+src/domain/models/deduplication_report.py
+This module defines the DeduplicationReportModel, which summarizes the effect of near-duplicate detection.
+"""
+
+from typing import TypedDict
+
+
+class DeduplicationReportModel(TypedDict):
+    """
+    Represents the storage and prompt reduction obtained by near-duplicate detection.
+
+    Attributes:
+        articles (int): Number of articles processed.
+        clusters (int): Number of distinct near-duplicate clusters.
+        duplicates (int): Number of articles detected as near-duplicates.
+        content_chars_before (int): Characters of article content before deduplication.
+        content_chars_after (int): Characters of article content kept after deduplication.
+        prompt_tokens_before (int): Estimated prompt tokens when sending every article.
+        prompt_tokens_after (int): Estimated prompt tokens when sending one article per cluster.
+    """
+
+    articles: int
+    clusters: int
+    duplicates: int
+    content_chars_before: int
+    content_chars_after: int
+    prompt_tokens_before: int
+    prompt_tokens_after: int
@@ -0,0 +1,202 @@
+"""
+src/infrastructure/async_database_manager.py
+
+This module contains the AsyncDatabaseManager class, the asyncio counterpart of DatabaseManager, based on SQLAlchemy and aiosqlite.
+"""
+
+import os
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Executable, Row, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import InstrumentedAttribute
+
+from infrastructure.database_manager import (
+    get_keyset_statement,
+    get_lookup_statement,
+)
+
+
+class AsyncDatabaseManager:
+    """
+    This class manages an asynchronous database connection and transactions using SQLAlchemy.
+
+    It shares the models and the cached lookup statements of DatabaseManager, so that
+    asyncio code can read and write the same tables without blocking the event loop.
+    """
+
+    def __init__(
+        self, database_url: Optional[str] = "sqlite+aiosqlite:///database.db"
+    ) -> None:
+        if database_url is None:
+            project_root = os.path.abspath(
+                os.path.join(os.path.dirname(__file__), "..", "..")
+            )
+            database_path = os.path.join(project_root, "database.db")
+            database_url = f"sqlite+aiosqlite:///{database_path}"
+
+        self.engine = create_async_engine(database_url, echo=True)
+        self.session_local = async_sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+        )
+
+    def get_database_connection(self) -> AsyncSession:
+        """
+        Retrieve a new asynchronous database session.
+
+        Returns:
+            AsyncSession: A new SQLAlchemy asynchronous session object.
+        """
+        return self.session_local()
+
+    async def create_to_database(self, instance: Any) -> None:
+        """
+        Save a new instance to the database.
+
+        Parameters:
+            instance: The SQLAlchemy model instance to be saved.
+
+        Raises:
+            Exception: If an error occurs during the commit, the session is rolled back and the exception is re-raised.
+        """
+        async with self.get_database_connection() as session:
+            try:
+                session.add(instance)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def execute_raw_query(
+        self, query: str, params: Optional[dict] = None
+    ) -> List[Row]:
+        """
+        Execute a raw SQL query.
+
+        Parameters:
+            query (str): The raw SQL query.
+            params (Optional[dict]): Parameters for the query. Defaults to None.
+
+        Returns:
+            List[Row]: The rows returned by the query, empty if it returns none.
+
+        Raises:
+            Exception: If an error occurs during the commit, the session is rolled back and the exception is re-raised.
+        """
+        async with self.get_database_connection() as session:
+            try:
+                result = await session.execute(text(query), params or {})
+                rows = list(result.all()) if result.returns_rows else []
+                await session.commit()
+                return rows
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def stream_query(
+        self,
+        statement: Executable | str,
+        params: Optional[dict] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream the rows of a query in chunks, keeping memory flat on large tables.
+
+        Parameters:
+            statement (Executable | str): The query, as a SQLAlchemy statement or raw SQL.
+            params (Optional[dict]): Parameters for the query. Defaults to None.
+            chunk_size (int): The number of rows per chunk. Defaults to 1000.
+
+        Yields:
+            Sequence[Row]: The next chunk of rows.
+        """
+        if isinstance(statement, str):
+            statement = text(statement)
+
+        async with self.get_database_connection() as session:
+            result = await session.stream(
+                statement,
+                params or {},
+                execution_options={"yield_per": chunk_size},
+            )
+            async for partition in result.partitions(chunk_size):
+                yield partition
+
+    async def get_keyset_page(
+        self,
+        columns: Sequence[InstrumentedAttribute],
+        after: Optional[Tuple[Any, ...]] = None,
+        page_size: int = 1000,
+    ) -> List[Any]:
+        """
+        Get one page of instances ordered by indexed columns, using keyset pagination.
+
+        Parameters:
+            columns (Sequence[InstrumentedAttribute]): The non-null ordering columns of one model, unique together.
+            after (Optional[Tuple[Any, ...]]): The column values of the last instance of the previous page. Defaults to the first page.
+            page_size (int): The maximum number of instances per page. Defaults to 1000.
+
+        Returns:
+            List[Any]: The instances of the page.
+
+        Raises:
+            ValueError: If one of the columns is nullable.
+        """
+        statement = get_keyset_statement(columns, after, page_size)
+        async with self.get_database_connection() as session:
+            return list(await session.scalars(statement))
+
+    async def iterate_keyset(
+        self, columns: Sequence[InstrumentedAttribute], page_size: int = 1000
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Iterate over all instances of a model page by page, using keyset pagination.
+
+        Parameters:
+            columns (Sequence[InstrumentedAttribute]): The non-null ordering columns of one model, unique together.
+            page_size (int): The maximum number of instances per page. Defaults to 1000.
+
+        Yields:
+            List[Any]: The next page of instances.
+
+        Raises:
+            ValueError: If one of the columns is nullable.
+        """
+        after: Optional[Tuple[Any, ...]] = None
+        while True:
+            page = await self.get_keyset_page(columns, after, page_size)
+            if not page:
+                return
+            yield page
+            after = tuple(getattr(page[-1], column.key) for column in columns)
+
+    async def exists_by(self, column: InstrumentedAttribute, value: Any) -> bool:
+        """
+        Check whether an instance with the given column value exists.
+
+        Parameters:
+            column (InstrumentedAttribute): The column to filter on, e.g. ArticleEntity.link.
+            value (Any): The value to look for.
+
+        Returns:
+            bool: True if a matching instance exists.
+        """
+        async with self.get_database_connection() as session:
+            statement = get_lookup_statement("exists", column)
+            result = await session.execute(statement, {"value": value})
+            return result.first() is not None
+
+    async def get_by(self, column: InstrumentedAttribute, value: Any) -> Optional[Any]:
+        """
+        Get the first instance with the given column value.
+
+        Parameters:
+            column (InstrumentedAttribute): The column to filter on, e.g. ArticleEntity.link.
+            value (Any): The value to look for.
+
+        Returns:
+            Optional[Any]: The matching instance or None if not found.
+        """
+        async with self.get_database_connection() as session:
+            statement = get_lookup_statement("get", column)
+            return (await session.scalars(statement, {"value": value})).first()
@@ -0,0 +1,350 @@
+"""
+src/infrastructure/bar_aggregator_manager.py
+This module provides a streaming aggregator that builds OHLCV bars for several timeframes at once.
+"""
+
+from collections import deque
+from datetime import datetime, time, timedelta, timezone
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from pandas import DataFrame
+
+from domain.models.bar import BarModel
+
+BarCallback = Callable[[BarModel], None]
+
+TIMEFRAME_UNITS = {"m": 60, "h": 3600, "d": 86400}
+BAR_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+EPOCH = datetime(1970, 1, 1)
+SECONDS_PER_DAY = 86400
+MAX_SESSION_SECONDS = 25 * 3600
+
+
+class _BarState:
+    """
+    The open (not yet closed) bar of a timeframe.
+    """
+
+    __slots__ = ("bucket", "start", "updated", "open", "high", "low", "close", "volume")
+
+    def __init__(
+        self,
+        bucket: int,
+        start: float,
+        updated: float,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        self.bucket = bucket
+        self.start = start
+        self.updated = updated
+        self.open = open_price
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+
+class BarAggregatorManager:
+    """
+    This class consumes ticks or base bars once and incrementally updates the OHLCV
+    bar of every configured timeframe.
+
+    Daily bars are bucketed on the wall clock of the session timezone, shifted by the
+    session start, so that they roll over at the session open (e.g. 17:00
+    America/New_York for forex) across daylight saving time changes. Intraday bars
+    are bucketed on the absolute time elapsed since the session open of their day, so
+    that they stay aligned to the session open all year, never span the daily
+    rollover, and the hour repeated when the clocks go back still yields separate
+    bars. When a tick falls into a new bucket, the previous bar is closed, stored in
+    the history and emitted to the subscribers of its timeframe.
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[str] = ("1m", "5m", "15m", "1h", "1d"),
+        timezone_name: str = "UTC",
+        session_start: time = time(0, 0),
+        history_size: int = 5000,
+    ) -> None:
+        """
+        Initializes the BarAggregatorManager.
+
+        Args:
+            timeframes (Iterable[str]): The timeframes to build (e.g., '1m', '5m', '1h', '1d').
+            timezone_name (str): The IANA name of the session timezone. Defaults to 'UTC'.
+            session_start (time): The time of day, in the session timezone, at which
+                                  daily bars start. Defaults to midnight.
+            history_size (int): The number of closed bars kept per timeframe. Defaults to 5000.
+        """
+        self.timeframes: List[Tuple[str, int, int]] = []
+        for timeframe in timeframes:
+            seconds = self.parse_timeframe(timeframe)
+            slots = (
+                0
+                if seconds % SECONDS_PER_DAY == 0
+                else MAX_SESSION_SECONDS // seconds + 1
+            )
+            self.timeframes.append((timeframe, seconds, slots))
+        self.timezone = ZoneInfo(timezone_name)
+        self.session_offset = session_start.hour * 3600 + session_start.minute * 60
+        self.history: Dict[str, Deque[BarModel]] = {
+            timeframe: deque(maxlen=history_size) for timeframe, _, _ in self.timeframes
+        }
+        self.subscribers: Dict[str, List[BarCallback]] = {
+            timeframe: [] for timeframe, _, _ in self.timeframes
+        }
+        self._states: Dict[str, Optional[_BarState]] = {
+            timeframe: None for timeframe, _, _ in self.timeframes
+        }
+        self._offset_key: Optional[int] = None
+        self._utc_offset = 0
+        self._session_day: Optional[int] = None
+        self._session_open = 0.0
+
+    @staticmethod
+    def parse_timeframe(timeframe: str) -> int:
+        """
+        Convert a timeframe label into its length in seconds.
+
+        Args:
+            timeframe (str): The timeframe label (e.g., '1m', '15m', '4h', '1d').
+
+        Returns:
+            int: The length of the timeframe in seconds.
+
+        Raises:
+            ValueError: If the label is malformed or its unit is not supported.
+        """
+        count, unit = timeframe[:-1], timeframe[-1:]
+        if not count.isdigit() or unit not in TIMEFRAME_UNITS or int(count) == 0:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+        return int(count) * TIMEFRAME_UNITS[unit]
+
+    def subscribe(self, timeframe: str, callback: BarCallback) -> None:
+        """
+        Register a callback called with every bar closed on the given timeframe.
+
+        Args:
+            timeframe (str): The timeframe to subscribe to.
+            callback (BarCallback): The function called with each closed bar.
+
+        Raises:
+            ValueError: If the timeframe is not configured on this aggregator.
+        """
+        if timeframe not in self.subscribers:
+            raise ValueError(f"Timeframe not configured: {timeframe}")
+        self.subscribers[timeframe].append(callback)
+
+    def update_tick(
+        self, timestamp: datetime | float, price: float, volume: float = 0.0
+    ) -> None:
+        """
+        Update every timeframe with a new tick.
+
+        Args:
+            timestamp (datetime | float): The tick time, as a datetime (naive values are
+                                          taken as UTC) or as POSIX seconds.
+            price (float): The traded price.
+            volume (float): The traded volume. Defaults to 0.0.
+        """
+        self._update(timestamp, price, price, price, price, volume)
+
+    def update_bar(
+        self,
+        timestamp: datetime | float,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """
+        Update every timeframe with a new base bar (e.g., a 1m bar from the broker).
+
+        The base bar must not span a boundary of any configured timeframe, which holds
+        as long as every timeframe is a multiple of the base bar length.
+
+        Args:
+            timestamp (datetime | float): The opening time of the base bar.
+            open_price (float): The opening price.
+            high (float): The highest price.
+            low (float): The lowest price.
+            close (float): The closing price.
+            volume (float): The traded volume.
+        """
+        self._update(timestamp, open_price, high, low, close, volume)
+
+    def flush(self) -> None:
+        """
+        Close and emit the open bar of every timeframe, e.g. at the end of a session.
+        """
+        for timeframe, _, _ in self.timeframes:
+            state = self._states[timeframe]
+            if state is not None:
+                self._close_bar(timeframe, state)
+                self._states[timeframe] = None
+
+    def get_bars(self, timeframe: str) -> DataFrame:
+        """
+        Get the closed bars of a timeframe as a DataFrame.
+
+        Args:
+            timeframe (str): The timeframe of the bars.
+
+        Returns:
+            DataFrame: The bars indexed by opening time, with the 'Open', 'High', 'Low',
+                       'Close' and 'Volume' columns expected by TechnicalIndicatorManager.
+        """
+        bars = self.history[timeframe]
+        if not bars:
+            return DataFrame(columns=BAR_COLUMNS)
+        return DataFrame(bars).set_index("time")[BAR_COLUMNS]
+
+    def _update(
+        self,
+        timestamp: datetime | float,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """
+        Fold a price update into the open bar of every timeframe.
+
+        Late updates falling into an earlier bucket than the open bar are dropped, since
+        that bar has already been emitted. Late updates inside the open bar still count
+        towards its high, low and volume, but do not overwrite a newer close.
+
+        Args:
+            timestamp (datetime | float): The time of the update.
+            open_price (float): The opening price of the update.
+            high (float): The highest price of the update.
+            low (float): The lowest price of the update.
+            close (float): The closing price of the update.
+            volume (float): The traded volume of the update.
+        """
+        epoch_seconds = self._to_epoch_seconds(timestamp)
+        wall_seconds = self._to_wall_seconds(epoch_seconds)
+        day = int(wall_seconds // SECONDS_PER_DAY)
+        session_open = self._get_session_open(day)
+        elapsed = max(epoch_seconds - session_open, 0.0)
+
+        for timeframe, seconds, slots in self.timeframes:
+            if slots:
+                index = int(elapsed // seconds)
+                bucket = day * slots + index
+            else:
+                bucket = int(wall_seconds // seconds)
+            state = self._states[timeframe]
+
+            if state is None or bucket > state.bucket:
+                if state is not None:
+                    self._close_bar(timeframe, state)
+                if slots:
+                    start = session_open + index * seconds
+                else:
+                    start = self._get_session_open(bucket * seconds // SECONDS_PER_DAY)
+                self._states[timeframe] = _BarState(
+                    bucket, start, epoch_seconds, open_price, high, low, close, volume
+                )
+                continue
+
+            if bucket < state.bucket:
+                continue
+
+            if high > state.high:
+                state.high = high
+            if low < state.low:
+                state.low = low
+            if epoch_seconds >= state.updated:
+                state.close = close
+                state.updated = epoch_seconds
+            state.volume += volume
+
+    @staticmethod
+    def _to_epoch_seconds(timestamp: datetime | float) -> float:
+        """
+        Convert a timestamp into POSIX seconds.
+
+        Args:
+            timestamp (datetime | float): The timestamp, naive datetimes being taken as UTC.
+
+        Returns:
+            float: The number of seconds since the epoch.
+        """
+        if isinstance(timestamp, datetime):
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            return timestamp.timestamp()
+        return float(timestamp)
+
+    def _to_wall_seconds(self, epoch_seconds: float) -> float:
+        """
+        Convert POSIX seconds into seconds on the session wall clock, counted from the
+        session start.
+
+        The UTC offset of the session timezone is cached per quarter of an hour, since
+        it only changes on daylight saving time transitions.
+
+        Args:
+            epoch_seconds (float): The number of seconds since the epoch.
+
+        Returns:
+            float: The number of wall clock session seconds since the epoch.
+        """
+        offset_key = int(epoch_seconds // 900)
+        if offset_key != self._offset_key:
+            utc_time = datetime.fromtimestamp(epoch_seconds, tz=timezone.utc)
+            offset = utc_time.astimezone(self.timezone).utcoffset()
+            self._utc_offset = int(offset.total_seconds()) if offset else 0
+            self._offset_key = offset_key
+
+        return epoch_seconds + self._utc_offset - self.session_offset
+
+    def _get_session_open(self, day: int) -> float:
+        """
+        Get the instant at which a session day opens.
+
+        The last computed day is cached, since consecutive ticks share their day.
+
+        Args:
+            day (int): The number of session days since the epoch.
+
+        Returns:
+            float: The POSIX seconds of the session open.
+        """
+        if day != self._session_day:
+            wall_time = EPOCH + timedelta(
+                seconds=day * SECONDS_PER_DAY + self.session_offset
+            )
+            self._session_open = wall_time.replace(tzinfo=self.timezone).timestamp()
+            self._session_day = day
+        return self._session_open
+
+    def _close_bar(self, timeframe: str, state: _BarState) -> None:
+        """
+        Store a closed bar in the history and emit it to the subscribers.
+
+        Args:
+            timeframe (str): The timeframe of the bar.
+            state (_BarState): The bar to close.
+        """
+        bar: BarModel = {
+            "timeframe": timeframe,
+            "time": datetime.fromtimestamp(state.start, tz=self.timezone),
+            "Open": state.open,
+            "High": state.high,
+            "Low": state.low,
+            "Close": state.close,
+            "Volume": state.volume,
+        }
+        self.history[timeframe].append(bar)
+
+        for callback in self.subscribers[timeframe]:
+            callback(bar)
@@ -5,16 +5,84 @@ This module contains the DatabaseManager class, which manages the database conne
 """
 
 import os
-from typing import Any, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Result
+from sqlalchemy import (
+    Executable,
+    Select,
+    bindparam,
+    create_engine,
+    inspect,
+    literal,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute, Session, sessionmaker
 
 Base = declarative_base()
 
 
+LOOKUP_STATEMENTS: Dict[Tuple[str, InstrumentedAttribute], Select] = {}
+
+
+def get_lookup_statement(kind: str, column: InstrumentedAttribute) -> Select:
+    """
+    Get the cached statement of a hot lookup on a column.
+
+    Reusing the same statement object lets SQLAlchemy reuse its compiled form and
+    the driver reuse its prepared statement.
+
+    Parameters:
+        kind (str): 'exists' to select a constant, 'get' to select the instance.
+        column (InstrumentedAttribute): The column to filter on.
+
+    Returns:
+        Select: The statement, with a 'value' bound parameter.
+    """
+    key = (kind, column)
+    if key not in LOOKUP_STATEMENTS:
+        target = literal(1) if kind == "exists" else column.class_
+        LOOKUP_STATEMENTS[key] = (
+            select(target).where(column == bindparam("value")).limit(1)
+        )
+    return LOOKUP_STATEMENTS[key]
+
+
+def get_keyset_statement(
+    columns: Sequence[InstrumentedAttribute],
+    after: Optional[Tuple[Any, ...]],
+    page_size: int,
+) -> Select:
+    """
+    Build the statement of one keyset page ordered by the given columns.
+
+    A NULL key would make the row comparison unknown and silently end the iteration,
+    so nullable columns are rejected.
+
+    Parameters:
+        columns (Sequence[InstrumentedAttribute]): The non-null ordering columns of one model, unique together.
+        after (Optional[Tuple[Any, ...]]): The column values of the last instance of the previous page, or None for the first page.
+        page_size (int): The maximum number of instances per page.
+
+    Returns:
+        Select: The statement of the page.
+
+    Raises:
+        ValueError: If one of the columns is nullable.
+    """
+    for column in columns:
+        if column.expression.nullable:
+            raise ValueError(f"Keyset column {column.key} must not be nullable")
+
+    statement = select(columns[0].class_).order_by(*columns).limit(page_size)
+    if after is not None:
+        statement = statement.where(tuple_(*columns) > tuple_(*after))
+    return statement
+
+
 class DatabaseManager:
     """
     This class manages the database connection and transactions using SQLAlchemy.
@@ -30,7 +98,7 @@ class DatabaseManager:
 
         self.engine = create_engine(database_url, echo=True)
         self.session_local = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
         )
 
     def get_database_connection(self) -> Session:
@@ -42,6 +110,48 @@ class DatabaseManager:
         """
         return self.session_local()
 
+    def upgrade_schema(self) -> None:
+        """
+        Bring an existing database up to date with the models imported so far.
+
+        Missing tables and indexes are created, missing columns are added with
+        ALTER TABLE, and NULL values of non-nullable columns with a default (e.g. the
+        created_at of articles stored before the column existed) are filled. Running
+        it again on an up-to-date database changes nothing.
+
+        Raises:
+            Exception: If an error occurs, the transaction is rolled back and the exception is re-raised.
+        """
+        Base.metadata.create_all(self.engine)
+
+        with self.engine.begin() as connection:
+            inspector = inspect(connection)
+            for table in Base.metadata.sorted_tables:
+                existing_columns = {
+                    column["name"] for column in inspector.get_columns(table.name)
+                }
+                for column in table.columns:
+                    if column.name not in existing_columns:
+                        column_type = column.type.compile(dialect=self.engine.dialect)
+                        connection.execute(
+                            text(
+                                f"ALTER TABLE {table.name} "
+                                f"ADD COLUMN {column.name} {column_type}"
+                            )
+                        )
+
+                    if column.nullable or column.primary_key or column.default is None:
+                        continue
+                    value = column.default.arg
+                    if callable(value):
+                        value = value(None)
+                    connection.execute(
+                        table.update().where(column.is_(None)).values({column: value})
+                    )
+
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
+
     def create_to_database(self, instance: Any) -> None:
         """
         Save a new instance to the database.
@@ -96,18 +206,143 @@ class DatabaseManager:
                 session.rollback()
                 raise
 
-    def execute_raw_query(self, query: str, params: Optional[dict] = None) -> Result:
+    def execute_raw_query(self, query: str, params: Optional[dict] = None) -> List[Row]:
         """
         Execute a raw SQL query.
 
+        The rows are fetched before the session is closed, so the result stays usable.
+
         Parameters:
             query (str): The raw SQL query.
             params (Optional[dict]): Parameters for the query. Defaults to None.
 
         Returns:
-            Result: The result of the query execution.
+            List[Row]: The rows returned by the query, empty if it returns none.
+
+        Raises:
+            Exception: If an error occurs during the commit, the session is rolled back and the exception is re-raised.
+        """
+        with self.get_database_connection() as session:
+            try:
+                result = session.execute(text(query), params or {})
+                rows = list(result.all()) if result.returns_rows else []
+                session.commit()
+                return rows
+            except Exception:
+                session.rollback()
+                raise
+
+    def stream_query(
+        self,
+        statement: Executable | str,
+        params: Optional[dict] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Stream the rows of a query in chunks, keeping memory flat on large tables.
+
+        Rows are fetched with a server-side cursor, chunk_size at a time, and the
+        session stays open until the iteration ends.
+
+        Parameters:
+            statement (Executable | str): The query, as a SQLAlchemy statement or raw SQL.
+            params (Optional[dict]): Parameters for the query. Defaults to None.
+            chunk_size (int): The number of rows per chunk. Defaults to 1000.
+
+        Yields:
+            Sequence[Row]: The next chunk of rows.
+        """
+        if isinstance(statement, str):
+            statement = text(statement)
+
+        with self.get_database_connection() as session:
+            result = session.execute(
+                statement,
+                params or {},
+                execution_options={"yield_per": chunk_size, "stream_results": True},
+            )
+            yield from result.partitions(chunk_size)
+
+    def get_keyset_page(
+        self,
+        columns: Sequence[InstrumentedAttribute],
+        after: Optional[Tuple[Any, ...]] = None,
+        page_size: int = 1000,
+    ) -> List[Any]:
+        """
+        Get one page of instances ordered by indexed columns, using keyset pagination.
+
+        Unlike OFFSET, the cost of a page does not grow with its position. The columns
+        must be non-null and unique together, e.g. (ArticleEntity.id,).
+
+        Parameters:
+            columns (Sequence[InstrumentedAttribute]): The non-null ordering columns of one model, unique together.
+            after (Optional[Tuple[Any, ...]]): The column values of the last instance of the previous page. Defaults to the first page.
+            page_size (int): The maximum number of instances per page. Defaults to 1000.
+
+        Returns:
+            List[Any]: The instances of the page.
+
+        Raises:
+            ValueError: If one of the columns is nullable.
+        """
+        statement = get_keyset_statement(columns, after, page_size)
+        with self.get_database_connection() as session:
+            return list(session.scalars(statement))
+
+    def iterate_keyset(
+        self, columns: Sequence[InstrumentedAttribute], page_size: int = 1000
+    ) -> Iterator[List[Any]]:
+        """
+        Iterate over all instances of a model page by page, using keyset pagination.
+
+        Each page is read in its own short session, so no transaction is held open
+        between pages.
+
+        Parameters:
+            columns (Sequence[InstrumentedAttribute]): The non-null ordering columns of one model, unique together.
+            page_size (int): The maximum number of instances per page. Defaults to 1000.
+
+        Yields:
+            List[Any]: The next page of instances.
+
+        Raises:
+            ValueError: If one of the columns is nullable.
+        """
+        after: Optional[Tuple[Any, ...]] = None
+        while True:
+            page = self.get_keyset_page(columns, after, page_size)
+            if not page:
+                return
+            yield page
+            after = tuple(getattr(page[-1], column.key) for column in columns)
+
+    def exists_by(self, column: InstrumentedAttribute, value: Any) -> bool:
+        """
+        Check whether an instance with the given column value exists.
+
+        Parameters:
+            column (InstrumentedAttribute): The column to filter on, e.g. ArticleEntity.link.
+            value (Any): The value to look for.
+
+        Returns:
+            bool: True if a matching instance exists.
+        """
+        with self.get_database_connection() as session:
+            statement = get_lookup_statement("exists", column)
+            return session.execute(statement, {"value": value}).first() is not None
+
+    def get_by(self, column: InstrumentedAttribute, value: Any) -> Optional[Any]:
+        """
+        Get the first instance with the given column value.
+
+        Parameters:
+            column (InstrumentedAttribute): The column to filter on, e.g. ArticleEntity.link.
+            value (Any): The value to look for.
+
+        Returns:
+            Optional[Any]: The matching instance or None if not found.
         """
         with self.get_database_connection() as session:
-            result: Result = session.execute(query, params or {})
-            session.commit()
-            return result
+            statement = get_lookup_statement("get", column)
+            return session.scalars(statement, {"value": value}).first()
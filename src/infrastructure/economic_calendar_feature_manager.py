@@ -0,0 +1,289 @@
+"""
+src/infrastructure/economic_calendar_feature_manager.py
+This module provides a class for turning economic calendar events into numeric, bar-aligned features.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from pandas import (
+    DataFrame,
+    DatetimeIndex,
+    Series,
+    Timedelta,
+    factorize,
+    to_datetime,
+    to_numeric,
+    to_timedelta,
+)
+
+VALUE_PATTERN = r"^([+-]?\d*\.?\d+)\s*([KMBT%]?)$"
+TIME_PATTERN = r"^\d{1,2}:\d{2}$"
+UNIT_SCALES: Dict[str, float] = {
+    "": 1.0,
+    "%": 1.0,
+    "K": 1e3,
+    "M": 1e6,
+    "B": 1e9,
+    "T": 1e12,
+}
+IMPORTANCE_WEIGHTS: Dict[str, float] = {"low": 1.0, "medium": 2.0, "high": 3.0}
+
+CALENDAR_EVENT_DTYPE = np.dtype(
+    [
+        ("timestamp", "datetime64[ns]"),
+        ("currency", "U3"),
+        ("importance", "f4"),
+        ("actual", "f8"),
+        ("forecast", "f8"),
+        ("previous", "f8"),
+        ("is_percent", "?"),
+        ("surprise", "f8"),
+        ("weighted_surprise", "f8"),
+    ]
+)
+
+
+class EconomicCalendarFeatureManager:
+    """
+    This class parses the economic calendar returned by investpy into numeric columns
+    and aligns the events onto the index of an OHLCV DataFrame.
+
+    It expects a DataFrame with the 'date', 'time', 'currency', 'importance',
+    'actual', 'forecast' and 'previous' columns of investpy's economic calendar.
+    Values such as '2.5%', '1.2K' or '-0.3B' are converted to floats, with
+    percentages kept in percentage points.
+    """
+
+    def __init__(self, events: DataFrame, timezone_name: str = "UTC"):
+        """
+        Initializes the EconomicCalendarFeatureManager with raw calendar events.
+
+        Args:
+            events (DataFrame): The raw economic calendar events.
+            timezone_name (str): The timezone of the event dates and times. Defaults to 'UTC'.
+        """
+        self.events = self.parse_events(events, timezone_name)
+
+    @staticmethod
+    def parse_values(values: Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse textual values such as '2.5%', '1,200', '1.2K' or '-0.3B' into floats.
+
+        Calendar values repeat a lot, so only the distinct strings are parsed and the
+        results are broadcast back with their factorized codes.
+
+        Args:
+            values (Series): The textual values, missing or unparsable ones become NaN.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The parsed values, and whether each value is a percentage.
+        """
+        codes, uniques = factorize(values)
+        parts = (
+            Series(uniques, dtype="string")
+            .str.strip()
+            .str.replace(",", "", regex=False)
+            .str.extract(VALUE_PATTERN)
+        )
+        numbers = to_numeric(parts[0]).to_numpy(dtype="float64", na_value=np.nan)
+        units = parts[1].fillna("")
+        scales = units.map(UNIT_SCALES).to_numpy(dtype="float64", na_value=np.nan)
+
+        parsed = np.append(numbers * scales, np.nan)
+        is_percent = np.append((units == "%").to_numpy(dtype=bool), False)
+        return parsed[codes], is_percent[codes]
+
+    @staticmethod
+    def parse_timestamps(dates: Series, times: Series, timezone_name: str) -> Series:
+        """
+        Combine 'dd/mm/yyyy' dates and 'HH:MM' times into UTC timestamps.
+
+        Events without a time of day ('All Day', 'Tentative') are placed at midnight,
+        and ambiguous times at the end of daylight saving time are read as standard
+        time. As with values, only the distinct dates and times are parsed.
+
+        Args:
+            dates (Series): The event dates.
+            times (Series): The event times.
+            timezone_name (str): The timezone of the dates and times.
+
+        Returns:
+            Series: The UTC timestamps, NaT where the date is missing or invalid.
+        """
+        date_codes, unique_dates = factorize(dates)
+        parsed_dates = to_datetime(
+            Series(unique_dates, dtype="string"), format="%d/%m/%Y", errors="coerce"
+        ).to_numpy(dtype="datetime64[ns]")
+
+        time_codes, unique_times = factorize(times)
+        unique_times = Series(unique_times, dtype="string").str.strip()
+        unique_times = unique_times.where(
+            unique_times.str.match(TIME_PATTERN).fillna(False), "00:00"
+        )
+        parsed_times = to_timedelta(unique_times + ":00").to_numpy(
+            dtype="timedelta64[ns]"
+        )
+
+        local_times = np.append(parsed_dates, np.datetime64("NaT"))[date_codes]
+        local_times = (
+            local_times + np.append(parsed_times, np.timedelta64(0, "ns"))[time_codes]
+        )
+        return (
+            Series(local_times)
+            .dt.tz_localize(
+                timezone_name,
+                ambiguous=np.zeros(len(local_times), dtype=bool),
+                nonexistent="shift_forward",
+            )
+            .dt.tz_convert("UTC")
+        )
+
+    @classmethod
+    def parse_events(cls, events: DataFrame, timezone_name: str = "UTC") -> DataFrame:
+        """
+        Parse raw calendar events into numeric columns, sorted by time.
+
+        The surprise is actual minus forecast, and the weighted surprise is the
+        surprise relative to the forecast, multiplied by the importance weight.
+
+        Args:
+            events (DataFrame): The raw economic calendar events.
+            timezone_name (str): The timezone of the event dates and times. Defaults to 'UTC'.
+
+        Returns:
+            DataFrame: The events with 'timestamp' (UTC), 'currency', 'importance',
+                       'actual', 'forecast', 'previous', 'is_percent', 'surprise'
+                       and 'weighted_surprise' columns.
+        """
+        actual, actual_is_percent = cls.parse_values(events["actual"])
+        forecast, forecast_is_percent = cls.parse_values(events["forecast"])
+        previous, previous_is_percent = cls.parse_values(events["previous"])
+        importance = (
+            events["importance"]
+            .astype("string")
+            .str.lower()
+            .map(IMPORTANCE_WEIGHTS)
+            .to_numpy(dtype="float64", na_value=0.0)
+        )
+
+        surprise = actual - forecast
+        relative_surprise = np.divide(
+            surprise,
+            np.abs(forecast),
+            out=np.zeros_like(surprise),
+            where=np.isfinite(surprise) & (forecast != 0),
+        )
+
+        parsed = DataFrame(
+            {
+                "timestamp": cls.parse_timestamps(
+                    events["date"], events["time"], timezone_name
+                ),
+                "currency": events["currency"].fillna("").to_numpy(dtype=str),
+                "importance": importance,
+                "actual": actual,
+                "forecast": forecast,
+                "previous": previous,
+                "is_percent": actual_is_percent
+                | forecast_is_percent
+                | previous_is_percent,
+                "surprise": surprise,
+                "weighted_surprise": relative_surprise * importance,
+            }
+        )
+        parsed = parsed[parsed["timestamp"].notna()]
+        return parsed.sort_values("timestamp", kind="stable").reset_index(drop=True)
+
+    def to_records(self) -> np.ndarray:
+        """
+        Get the parsed events as a compact NumPy structured array.
+
+        Returns:
+            np.ndarray: One record per event, with the CALENDAR_EVENT_DTYPE fields.
+        """
+        records = np.empty(len(self.events), dtype=CALENDAR_EVENT_DTYPE)
+        for name in CALENDAR_EVENT_DTYPE.names:
+            column = self.events[name]
+            if name == "timestamp":
+                column = column.dt.tz_localize(None)
+            records[name] = column.to_numpy()
+        return records
+
+    def align_to_bars(
+        self,
+        bar_index: DatetimeIndex,
+        bar_length: Optional[Timedelta | str] = None,
+        currencies: Optional[Iterable[str]] = None,
+    ) -> DataFrame:
+        """
+        Aggregate the events onto the bars of an OHLCV DataFrame.
+
+        Each event is assigned to the bar whose period contains it. Events before the
+        first bar or from the end of the last bar on, such as upcoming releases, are
+        ignored. The result shares the bar index, so it can be joined onto the output
+        of TechnicalIndicatorManager.
+
+        Args:
+            bar_index (DatetimeIndex): The sorted opening times of the bars. Naive times are taken as UTC.
+            bar_length (Optional[Timedelta | str]): The length of a bar (e.g., '1h'). Defaults to the frequency of bar_index.
+            currencies (Optional[Iterable[str]]): Only keep events of these currencies. Defaults to all.
+
+        Returns:
+            DataFrame: Per bar, the number of events ('calendar_events'), of high
+                       importance events ('calendar_high_importance'), the highest
+                       importance ('calendar_max_importance') and the sum of weighted
+                       surprises ('calendar_weighted_surprise').
+
+        Raises:
+            ValueError: If bar_length is not given and bar_index has no frequency.
+        """
+        if bar_length is None:
+            if bar_index.freq is None:
+                raise ValueError("bar_length is required when bar_index has no freq")
+            bar_length = bar_index.freq
+        bar_length_ns = Timedelta(bar_length).value
+
+        events = self.events
+        if currencies is not None:
+            events = events[events["currency"].isin(list(currencies))]
+
+        bar_times = bar_index
+        if bar_times.tz is not None:
+            bar_times = bar_times.tz_convert("UTC").tz_localize(None)
+        bar_times = bar_times.to_numpy(dtype="datetime64[ns]").view("i8")
+        event_times = (
+            events["timestamp"]
+            .dt.tz_localize(None)
+            .to_numpy(dtype="datetime64[ns]")
+            .view("i8")
+        )
+
+        positions = np.searchsorted(bar_times, event_times, side="right") - 1
+        valid = positions >= 0
+        if len(bar_times):
+            valid &= event_times < bar_times[-1] + bar_length_ns
+
+        positions = positions[valid]
+        importance = events["importance"].to_numpy()[valid]
+        weighted_surprise = np.nan_to_num(events["weighted_surprise"].to_numpy()[valid])
+        size = len(bar_times)
+
+        max_importance = np.zeros(size)
+        np.maximum.at(max_importance, positions, importance)
+
+        return DataFrame(
+            {
+                "calendar_events": np.bincount(positions, minlength=size),
+                "calendar_high_importance": np.bincount(
+                    positions,
+                    weights=importance >= IMPORTANCE_WEIGHTS["high"],
+                    minlength=size,
+                ).astype("int64"),
+                "calendar_max_importance": max_importance,
+                "calendar_weighted_surprise": np.bincount(
+                    positions, weights=weighted_surprise, minlength=size
+                ),
+            },
+            index=bar_index,
+        )
@@ -22,6 +22,7 @@ class ModelManager:
         self.model_name = "chatgpt-4o-latest"
         self.client = OpenAI(
             api_key=self.openai_key,
+            base_url=settings.api_openai_base_url(),
         )
 
     def generate_response(self, messages: List[ChatMessageModel]) -> str | None:
@@ -0,0 +1,378 @@
+"""
+src/infrastructure/near_duplicate_manager.py
+This module provides near-duplicate article detection based on shingling, MinHash and LSH.
+"""
+
+import hashlib
+import string
+import zlib
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from domain.entity.article import ArticleEntity
+from domain.entity.article_lsh_band import ArticleLshBandEntity
+from domain.models.deduplication_report import DeduplicationReportModel
+from infrastructure.database_manager import DatabaseManager
+
+MAX_HASH = np.uint64((1 << 32) - 1)
+HASH_SHIFT = np.uint64(32)
+SHINGLE_MULTIPLIER = np.uint64(0x100000001B3)
+PUNCTUATION_TABLE = str.maketrans(
+    {character: " " for character in string.punctuation + "‘’“”–—"}
+)
+CHARS_PER_TOKEN = 4
+
+
+class NearDuplicateManager:
+    """
+    This class clusters articles that republish the same story.
+
+    Each article text is split into word shingles, summarized by a MinHash signature
+    and indexed by LSH bands. An in-memory copy of the index for the most recent
+    articles answers lookups at ingest time, while the bands are persisted in the
+    `article_lsh_bands` table so that the index survives restarts.
+    """
+
+    def __init__(
+        self,
+        database_manager: DatabaseManager,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        threshold: float = 0.7,
+        max_recent: int = 10000,
+    ) -> None:
+        """
+        Initialize the near-duplicate manager, upgrade the database schema if needed
+        and load the index of recent articles.
+
+        Args:
+            database_manager (DatabaseManager): The database manager used to persist the index.
+            num_perm (int): Number of hash permutations in a signature. Defaults to 128.
+            bands (int): Number of LSH bands, must divide num_perm. Defaults to 16.
+            shingle_size (int): Number of words per shingle. Defaults to 5.
+            threshold (float): Minimum estimated Jaccard similarity of near-duplicates. Defaults to 0.7.
+            max_recent (int): Number of recent articles kept in the in-memory index. Defaults to 10000.
+
+        Raises:
+            ValueError: If bands does not divide num_perm.
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+
+        self.database_manager = database_manager
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.max_recent = max_recent
+
+        generator = np.random.default_rng(1)
+        self.perm_a = generator.integers(
+            0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True
+        ) | np.uint64(1)
+        self.perm_b = generator.integers(
+            0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True
+        )
+
+        self.buckets: Dict[Tuple[int, str], List[str]] = defaultdict(list)
+        self.recent: "OrderedDict[str, Tuple[np.ndarray, str]]" = OrderedDict()
+        self.database_manager.upgrade_schema()
+        self.load_recent()
+
+    def get_shingles(self, text: str) -> np.ndarray:
+        """
+        Split a text into hashed word shingles.
+
+        Words are hashed once, then combined over a sliding window, which avoids
+        hashing every shingle string separately.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            np.ndarray: The distinct 32-bit hashes of the shingles.
+        """
+        words = text.lower().translate(PUNCTUATION_TABLE).split() or [""]
+        word_hashes = np.fromiter(
+            (zlib.crc32(word.encode()) for word in words),
+            dtype=np.uint64,
+            count=len(words),
+        )
+
+        size = min(self.shingle_size, len(words))
+        count = len(words) - size + 1
+        shingles = word_hashes[:count].copy()
+        for offset in range(1, size):
+            shingles = (
+                shingles * SHINGLE_MULTIPLIER + word_hashes[offset : offset + count]
+            )
+
+        return np.unique(shingles & MAX_HASH)
+
+    def get_signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Each permutation is a multiply-add-shift hash of the 32-bit shingles, which
+        relies on the wrap-around of 64-bit arithmetic instead of a modulo.
+
+        Args:
+            text (str): The text to summarize.
+
+        Returns:
+            np.ndarray: The signature, an array of num_perm 32-bit values.
+        """
+        hashed = np.outer(self.get_shingles(text), self.perm_a)
+        hashed += self.perm_b
+        hashed >>= HASH_SHIFT
+        return hashed.min(axis=0).astype(np.uint32)
+
+    def get_band_buckets(self, signature: np.ndarray) -> List[str]:
+        """
+        Hash each LSH band of a signature into a bucket key.
+
+        Args:
+            signature (np.ndarray): The MinHash signature.
+
+        Returns:
+            List[str]: One hexadecimal bucket key per band.
+        """
+        return [
+            hashlib.blake2b(band.tobytes(), digest_size=8).hexdigest()
+            for band in signature.reshape(self.bands, -1)
+        ]
+
+    def find_cluster(self, signature: np.ndarray, buckets: List[str]) -> Optional[str]:
+        """
+        Find the cluster of the most similar recent article.
+
+        Args:
+            signature (np.ndarray): The MinHash signature of the new article.
+            buckets (List[str]): The band buckets of the new article.
+
+        Returns:
+            Optional[str]: The cluster id, or None if no recent article is similar enough.
+        """
+        best_cluster: Optional[str] = None
+        best_similarity = self.threshold
+
+        candidates = {
+            article_id
+            for band, bucket in enumerate(buckets)
+            for article_id in self.buckets.get((band, bucket), ())
+        }
+        for article_id in candidates:
+            candidate_signature, cluster_id = self.recent[article_id]
+            similarity = float(np.mean(candidate_signature == signature))
+            if similarity >= best_similarity:
+                best_cluster, best_similarity = cluster_id, similarity
+
+        return best_cluster
+
+    def cluster_article(self, article: ArticleEntity) -> List[str]:
+        """
+        Assign a signature and a cluster to an article.
+
+        Near-duplicates join the cluster of the most similar recent article and their
+        content is dropped, since the first article of the cluster already holds it.
+
+        Args:
+            article (ArticleEntity): The article to cluster, with its id set.
+
+        Returns:
+            List[str]: The band buckets of the article.
+        """
+        signature = self.get_signature(f"{article.title}\n{article.content or ''}")
+        buckets = self.get_band_buckets(signature)
+        cluster_id = self.find_cluster(signature, buckets)
+
+        if cluster_id is None:
+            cluster_id = article.id
+        else:
+            article.content = None
+
+        article.cluster_id = cluster_id
+        article.minhash = signature.tobytes()
+        return buckets
+
+    def add_article(self, article: ArticleEntity) -> None:
+        """
+        Cluster a new article, then store it together with its LSH bands.
+
+        Args:
+            article (ArticleEntity): The article to store, with its id set.
+
+        Raises:
+            Exception: If an error occurs during the commit, the session is rolled back and the exception is re-raised.
+        """
+        buckets = self.cluster_article(article)
+
+        with self.database_manager.get_database_connection() as session:
+            try:
+                session.add(article)
+                session.add_all(
+                    ArticleLshBandEntity(
+                        article_id=article.id, band=band, bucket=bucket
+                    )
+                    for band, bucket in enumerate(buckets)
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+        self.index_article(
+            article.id,
+            np.frombuffer(article.minhash, dtype=np.uint32),
+            article.cluster_id,
+            buckets,
+        )
+
+    def index_article(
+        self,
+        article_id: str,
+        signature: np.ndarray,
+        cluster_id: str,
+        buckets: List[str],
+    ) -> None:
+        """
+        Add an article to the in-memory index, evicting the oldest one when full.
+
+        Args:
+            article_id (str): The article id.
+            signature (np.ndarray): The MinHash signature of the article.
+            cluster_id (str): The cluster of the article.
+            buckets (List[str]): The band buckets of the article.
+        """
+        self.recent[article_id] = (signature, cluster_id)
+        for band, bucket in enumerate(buckets):
+            self.buckets[(band, bucket)].append(article_id)
+
+        if len(self.recent) <= self.max_recent:
+            return
+
+        evicted_id, (evicted_signature, _) = self.recent.popitem(last=False)
+        for band, bucket in enumerate(self.get_band_buckets(evicted_signature)):
+            members = self.buckets[(band, bucket)]
+            members.remove(evicted_id)
+            if not members:
+                del self.buckets[(band, bucket)]
+
+    def load_recent(self) -> None:
+        """
+        Load the persisted LSH index of the most recent articles into memory.
+        """
+        with self.database_manager.get_database_connection() as session:
+            rows = (
+                session.query(
+                    ArticleEntity.id, ArticleEntity.cluster_id, ArticleEntity.minhash
+                )
+                .filter(ArticleEntity.minhash.isnot(None))
+                .order_by(ArticleEntity.created_at.desc())
+                .limit(self.max_recent)
+                .all()
+            )
+            article_ids = [row.id for row in rows]
+            buckets: Dict[str, List[str]] = defaultdict(lambda: [""] * self.bands)
+            for chunk_start in range(0, len(article_ids), 500):
+                for band_row in session.query(ArticleLshBandEntity).filter(
+                    ArticleLshBandEntity.article_id.in_(
+                        article_ids[chunk_start : chunk_start + 500]
+                    )
+                ):
+                    buckets[band_row.article_id][band_row.band] = band_row.bucket
+
+        for row in reversed(rows):
+            self.index_article(
+                row.id,
+                np.frombuffer(row.minhash, dtype=np.uint32),
+                row.cluster_id,
+                buckets[row.id],
+            )
+
+    def backfill(self, dry_run: bool = False) -> DeduplicationReportModel:
+        """
+        Cluster the stored articles that have no signature yet, oldest first, and report
+        the storage and prompt-token reduction on them.
+
+        Prompt tokens are estimated as one token per four characters of title and content.
+        In a dry run, the articles are clustered the same way but nothing is committed
+        and the in-memory index is restored afterwards, so the report can be reviewed
+        before the content of the duplicates is dropped.
+
+        Args:
+            dry_run (bool): Whether to only compute the report. Defaults to False.
+
+        Returns:
+            DeduplicationReportModel: The reduction obtained on the processed articles.
+        """
+        report: DeduplicationReportModel = {
+            "articles": 0,
+            "clusters": 0,
+            "duplicates": 0,
+            "content_chars_before": 0,
+            "content_chars_after": 0,
+            "prompt_tokens_before": 0,
+            "prompt_tokens_after": 0,
+        }
+
+        with self.database_manager.get_database_connection() as session:
+            article_ids = [
+                row.id
+                for row in session.query(ArticleEntity.id)
+                .filter(ArticleEntity.minhash.is_(None))
+                .order_by(ArticleEntity.created_at)
+            ]
+
+        if dry_run:
+            saved_buckets = {
+                key: list(members) for key, members in self.buckets.items()
+            }
+            saved_recent = OrderedDict(self.recent)
+
+        for article_id in article_ids:
+            with self.database_manager.get_database_connection() as session:
+                try:
+                    article = session.get(ArticleEntity, article_id)
+                    content_chars = len(article.content or "")
+                    prompt_tokens = (
+                        len(article.title) + content_chars
+                    ) // CHARS_PER_TOKEN
+
+                    buckets = self.cluster_article(article)
+                    signature = np.frombuffer(article.minhash, dtype=np.uint32)
+                    cluster_id = article.cluster_id
+                    if dry_run:
+                        session.rollback()
+                    else:
+                        session.add_all(
+                            ArticleLshBandEntity(
+                                article_id=article_id, band=band, bucket=bucket
+                            )
+                            for band, bucket in enumerate(buckets)
+                        )
+                        session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+
+            self.index_article(article_id, signature, cluster_id, buckets)
+
+            is_duplicate = cluster_id != article_id
+            report["articles"] += 1
+            report["duplicates"] += int(is_duplicate)
+            report["clusters"] += int(not is_duplicate)
+            report["content_chars_before"] += content_chars
+            report["prompt_tokens_before"] += prompt_tokens
+            if not is_duplicate:
+                report["content_chars_after"] += content_chars
+                report["prompt_tokens_after"] += prompt_tokens
+
+        if dry_run:
+            self.buckets = defaultdict(list, saved_buckets)
+            self.recent = saved_recent
+
+        return report
@@ -4,13 +4,15 @@ This file contains the news and calendar manager for investing.com.
 """
 
 import random
+import uuid
 from datetime import datetime, timedelta
 from time import sleep
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import investpy
 import requests
 from bs4 import BeautifulSoup
+from pandas import DataFrame
 
 from config.headers import Headers
 from config.utile import retry_on_failure
@@ -19,6 +21,8 @@ from domain.models.article import ArticleModel
 from domain.models.chat_message import ChatMessageModel
 from domain.models.economic_calendar_event import EconomicCalendarEventModel
 from infrastructure.database_manager import DatabaseManager
+from infrastructure.near_duplicate_manager import NearDuplicateManager
+from infrastructure.summary_manager import SummaryManager
 
 
 class NewsAndCalendarManager:
@@ -26,15 +30,33 @@ class NewsAndCalendarManager:
     News and calendar manager for investing.com.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        database_manager: Optional[DatabaseManager] = None,
+        summary_manager: Optional[SummaryManager] = None,
+    ) -> None:
         """
         Initialize the news and calendar manager.
+
+        Args:
+            database_manager (Optional[DatabaseManager]): The database storing the articles. Defaults to a new DatabaseManager.
+            summary_manager (Optional[SummaryManager]): The background summarizer of new articles,
+                                                        started on the first new article. Defaults to no summaries.
         """
         self.base_url = "https://www.investing.com/"
         self.news_path = "news/forex-news"
         self.headers = Headers().get_headers()
         self.session = requests.Session()
-        self.database_manager = DatabaseManager()
+        self.database_manager = database_manager or DatabaseManager()
+        self.near_duplicate_manager = NearDuplicateManager(self.database_manager)
+        self.summary_manager = summary_manager
+
+    def stop(self) -> None:
+        """
+        Stop the background summarizer, if any, once its queued articles are summarized.
+        """
+        if self.summary_manager is not None:
+            self.summary_manager.stop()
 
     def get_article_from_db(self, link: str) -> Optional[ArticleModel]:
         """
@@ -46,10 +68,7 @@ class NewsAndCalendarManager:
         Returns:
             Optional[ArticleModel]: The existing instance or None if not found.
         """
-        with self.database_manager.get_database_connection() as session:
-            return (
-                session.query(ArticleEntity).filter(ArticleEntity.link == link).first()
-            )
+        return self.database_manager.get_by(ArticleEntity.link, link)
 
     @retry_on_failure()
     def get_articles_from_page(self, page: int = 1) -> List[ArticleModel]:
@@ -100,8 +119,13 @@ class NewsAndCalendarManager:
                 article = self.get_article_from_db(link)
                 if not article:
                     content = self.get_article_content(link) or ""
-                    article = ArticleEntity(title=title, link=link, content=content)
-                    self.database_manager.create_to_database(article)
+                    article = ArticleEntity(
+                        id=str(uuid.uuid4()), title=title, link=link, content=content
+                    )
+                    self.near_duplicate_manager.add_article(article)
+                    if self.summary_manager is not None and article.content:
+                        if not self.summary_manager.start():
+                            self.summary_manager.enqueue(article.id)
 
                     sleep(5)
                 articles.append(article)
@@ -147,6 +171,37 @@ class NewsAndCalendarManager:
             print(f"Error fetching article: {e} {header}")
             return None
 
+    def get_cluster_representatives(
+        self, articles: List[ArticleModel]
+    ) -> List[ArticleModel]:
+        """
+        Keep one article per near-duplicate cluster, in order of first appearance.
+
+        The representative is the first article of the cluster, which is the only one
+        holding the content. It is loaded from the database when it is not in the list.
+
+        Args:
+            articles (List[ArticleModel]): The articles to deduplicate.
+
+        Returns:
+            List[ArticleModel]: One article per cluster.
+        """
+        clusters: Dict[str, List[ArticleModel]] = {}
+        for article in articles:
+            clusters.setdefault(article.cluster_id or article.id, []).append(article)
+
+        representatives: List[ArticleModel] = []
+        for cluster_id, members in clusters.items():
+            representative = next(
+                (article for article in members if article.id == cluster_id), None
+            )
+            if representative is None:
+                with self.database_manager.get_database_connection() as session:
+                    representative = session.get(ArticleEntity, cluster_id)
+            representatives.append(representative or members[0])
+
+        return representatives
+
     def get_articles(self, nombre_page: int = 5) -> List[List[ArticleModel]]:
         """
         Retrieve articles from multiple pages.
@@ -166,6 +221,24 @@ class NewsAndCalendarManager:
         return all_articles
 
     @retry_on_failure()
+    def get_calendar_events_frame(
+        self, from_date: datetime, to_date: datetime
+    ) -> Optional[DataFrame]:
+        """
+        Get economic calendar events as a raw DataFrame, e.g. for EconomicCalendarFeatureManager.
+
+        Args:
+            from_date (datetime): The start date of the economic calendar events.
+            to_date (datetime): The end date of the economic calendar events.
+
+        Returns:
+            Optional[DataFrame]: The economic calendar events, one row per event.
+        """
+        return investpy.news.economic_calendar(
+            from_date=from_date.strftime("%d/%m/%Y"),
+            to_date=to_date.strftime("%d/%m/%Y"),
+        )
+
     def get_calendar_events(
         self, from_date: datetime, to_date: datetime
     ) -> List[EconomicCalendarEventModel]:
@@ -179,10 +252,9 @@ class NewsAndCalendarManager:
         Returns:
             List[EconomicCalendarEventModel]: The list of economic calendar events.
         """
-        df = investpy.news.economic_calendar(
-            from_date=from_date.strftime("%d/%m/%Y"),
-            to_date=to_date.strftime("%d/%m/%Y"),
-        )
+        df = self.get_calendar_events_frame(from_date=from_date, to_date=to_date)
+        if df is None:
+            return []
         return df.to_dict(orient="index")
 
     def get_context_news_and_economic_calendar(self) -> List[ChatMessageModel]:
@@ -199,7 +271,7 @@ class NewsAndCalendarManager:
         economic_calendar = self.get_calendar_events(
             from_date=from_date, to_date=to_date
         )
-        articles = self.get_articles_from_page(3)
+        articles = self.get_cluster_representatives(self.get_articles_from_page(3))
 
         messages: List[ChatMessageModel] = []
 
@@ -212,7 +284,8 @@ class NewsAndCalendarManager:
             )
 
         news_message = "Latest news articles:\n" + "\n".join(
-            f"- {article.title}: {article.content}" for article in articles
+            f"- {article.title}: {article.summary or article.content}"
+            for article in articles
         )
         messages.append({"role": "user", "content": news_message})
 
@@ -0,0 +1,230 @@
+"""
+src/infrastructure/summary_manager.py
+This module provides a background worker that summarizes stored articles in batches.
+"""
+
+import json
+from queue import Empty, Full, Queue
+from threading import Thread
+from typing import List, Optional, Tuple
+
+from config.utile import retry_on_failure
+from domain.entity.article import ArticleEntity
+from domain.models.chat_message import ChatMessageModel
+from infrastructure.database_manager import DatabaseManager
+from infrastructure.model_manager import ModelManager
+
+SUMMARY_INSTRUCTION = (
+    "You summarize forex news articles for a trading bot. "
+    "Summarize each article below in at most three sentences, keeping the figures, "
+    "currencies and central banks it mentions. Answer only with a JSON array of "
+    "strings, one summary per article, in the same order as the articles."
+)
+
+
+class SummaryManager:
+    """
+    This class fills the summary of stored articles in the background.
+
+    Article ids are pushed to a bounded queue at ingest. A worker thread drains the
+    queue, sends several articles per ModelManager call and stores the summaries.
+    Articles that do not fit in the queue, or whose batch keeps failing, stay without
+    a summary and are queued again the next time the worker starts.
+    """
+
+    def __init__(
+        self,
+        database_manager: DatabaseManager,
+        model_manager: Optional[ModelManager] = None,
+        batch_size: int = 5,
+        batch_timeout: float = 2.0,
+        max_queue_size: int = 100,
+    ) -> None:
+        """
+        Initialize the summary manager.
+
+        Args:
+            database_manager (DatabaseManager): The database manager storing the articles.
+            model_manager (Optional[ModelManager]): The model used to summarize. Defaults to a new ModelManager.
+            batch_size (int): The maximum number of articles per model call. Defaults to 5.
+            batch_timeout (float): Seconds to wait for a batch to fill up. Defaults to 2.0.
+            max_queue_size (int): The maximum number of queued articles. Defaults to 100.
+        """
+        self.database_manager = database_manager
+        self.model_manager = model_manager or ModelManager()
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.queue: Queue[Optional[str]] = Queue(maxsize=max_queue_size)
+        self.worker: Optional[Thread] = None
+
+    def start(self) -> bool:
+        """
+        Queue the stored articles still missing a summary and start the worker thread.
+
+        Does nothing if the worker is already running.
+
+        Returns:
+            bool: True if the worker was started, False if it was already running.
+        """
+        if self.worker is not None and self.worker.is_alive():
+            return False
+
+        self.database_manager.upgrade_schema()
+
+        with self.database_manager.get_database_connection() as session:
+            pending_ids = [
+                row.id
+                for row in session.query(ArticleEntity.id)
+                .filter(ArticleEntity.summary.is_(None))
+                .filter(ArticleEntity.content.isnot(None))
+                .filter(ArticleEntity.content != "")
+                .order_by(ArticleEntity.created_at.desc())
+                .limit(self.queue.maxsize)
+            ]
+        for article_id in pending_ids:
+            self.enqueue(article_id)
+
+        self.worker = Thread(target=self.run, name="summary-worker", daemon=True)
+        self.worker.start()
+        return True
+
+    def stop(self) -> None:
+        """
+        Stop the worker thread once the articles already queued are summarized.
+        """
+        if self.worker is None:
+            return
+
+        self.queue.put(None)
+        self.worker.join()
+        self.worker = None
+
+    def enqueue(self, article_id: str) -> bool:
+        """
+        Queue an article to be summarized, without blocking the caller.
+
+        Args:
+            article_id (str): The id of the article.
+
+        Returns:
+            bool: True if the article was queued, False if the queue is full.
+        """
+        try:
+            self.queue.put_nowait(article_id)
+            return True
+        except Full:
+            print(f"Summary queue full, article {article_id} postponed.")
+            return False
+
+    def run(self) -> None:
+        """
+        Summarize queued articles batch by batch until stopped.
+        """
+        stopping = False
+        while not stopping:
+            article_ids, stopping = self.get_batch()
+            if not article_ids:
+                continue
+
+            with self.database_manager.get_database_connection() as session:
+                articles = (
+                    session.query(ArticleEntity)
+                    .filter(ArticleEntity.id.in_(article_ids))
+                    .filter(ArticleEntity.summary.is_(None))
+                    .all()
+                )
+            if not articles:
+                continue
+
+            summaries = self.summarize_batch(articles)
+            if summaries is None:
+                print(f"Failed to summarize {len(articles)} articles.")
+                continue
+
+            try:
+                self.store_summaries(articles, summaries)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"Error storing summaries: {e}")
+
+    def get_batch(self) -> Tuple[List[str], bool]:
+        """
+        Wait for a queued article, then collect up to batch_size articles.
+
+        Returns:
+            Tuple[List[str], bool]: The article ids of the batch, and whether the worker was asked to stop.
+        """
+        article_ids: List[str] = []
+        article_id = self.queue.get()
+
+        while article_id is not None:
+            article_ids.append(article_id)
+            if len(article_ids) >= self.batch_size:
+                return article_ids, False
+            try:
+                article_id = self.queue.get(timeout=self.batch_timeout)
+            except Empty:
+                return article_ids, False
+
+        return article_ids, True
+
+    @retry_on_failure()
+    def summarize_batch(self, articles: List[ArticleEntity]) -> Optional[List[str]]:
+        """
+        Summarize several articles with a single model call.
+
+        Args:
+            articles (List[ArticleEntity]): The articles to summarize.
+
+        Returns:
+            Optional[List[str]]: One summary per article, or None if the call failed or
+                                 the answer is not a JSON array of the expected length.
+        """
+        messages: List[ChatMessageModel] = [
+            {"role": "system", "content": SUMMARY_INSTRUCTION},
+            {
+                "role": "user",
+                "content": "\n\n".join(
+                    f"Article {number}: {article.title}\n{article.content}"
+                    for number, article in enumerate(articles, start=1)
+                ),
+            },
+        ]
+
+        try:
+            response = self.model_manager.generate_response(messages) or ""
+            summaries = json.loads(
+                response.strip().removeprefix("```json").strip("`").strip()
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print(f"Error summarizing articles: {e}")
+            return None
+
+        if not isinstance(summaries, list) or len(summaries) != len(articles):
+            print("Unexpected summary answer from the model.")
+            return None
+
+        return [str(summary) for summary in summaries]
+
+    def store_summaries(
+        self, articles: List[ArticleEntity], summaries: List[str]
+    ) -> None:
+        """
+        Store the summaries of a batch of articles.
+
+        Args:
+            articles (List[ArticleEntity]): The summarized articles.
+            summaries (List[str]): One summary per article.
+
+        Raises:
+            Exception: If an error occurs during the commit, the session is rolled back and the exception is re-raised.
+        """
+        with self.database_manager.get_database_connection() as session:
+            try:
+                for article, summary in zip(articles, summaries):
+                    session.query(ArticleEntity).filter(
+                        ArticleEntity.id == article.id
+                    ).update({ArticleEntity.summary: summary})
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
@@ -0,0 +1,199 @@
+"""
+tests/test_bar_aggregator_manager.py
+This file checks the bucketing of the BarAggregatorManager around sessions and daylight saving time.
+"""
+
+from datetime import datetime, time, timezone
+from typing import List
+
+import pytest
+
+from domain.models.bar import BarModel
+from infrastructure.bar_aggregator_manager import BarAggregatorManager
+
+
+def feed_minutes(
+    aggregator: BarAggregatorManager, start: datetime, minutes: int
+) -> None:
+    """
+    Feed one tick per minute, priced by its rank starting at 1.
+
+    Args:
+        aggregator (BarAggregatorManager): The aggregator to feed.
+        start (datetime): The time of the first tick.
+        minutes (int): The number of ticks.
+    """
+    start_seconds = start.timestamp()
+    for minute in range(minutes):
+        aggregator.update_tick(start_seconds + minute * 60, minute + 1, 1.0)
+
+
+def get_bar_times(aggregator: BarAggregatorManager, timeframe: str) -> List[str]:
+    """
+    Format the opening times of the closed bars of a timeframe.
+
+    Args:
+        aggregator (BarAggregatorManager): The aggregator holding the bars.
+        timeframe (str): The timeframe of the bars.
+
+    Returns:
+        List[str]: The opening times, as 'YYYY-MM-DD HH:MM+HHMM'.
+    """
+    return [
+        bar_time.strftime("%Y-%m-%d %H:%M%z")
+        for bar_time in aggregator.get_bars(timeframe).index
+    ]
+
+
+def test_fall_back_keeps_the_repeated_hour_apart() -> None:
+    """
+    The hour repeated on 2025-11-02 in New York yields two 01:00 hourly bars.
+    """
+    aggregator = BarAggregatorManager(
+        ("1m", "1h"), "America/New_York", session_start=time(17, 0)
+    )
+    feed_minutes(aggregator, datetime(2025, 11, 2, 5, 0, tzinfo=timezone.utc), 180)
+    aggregator.flush()
+
+    assert len(aggregator.get_bars("1m")) == 180
+    assert get_bar_times(aggregator, "1h") == [
+        "2025-11-02 01:00-0400",
+        "2025-11-02 01:00-0500",
+        "2025-11-02 02:00-0500",
+    ]
+    assert aggregator.get_bars("1h")["Volume"].tolist() == [60.0, 60.0, 60.0]
+
+
+def test_spring_forward_skips_the_missing_hour() -> None:
+    """
+    The hour skipped on 2025-03-09 in New York yields no bar, and no bar is merged.
+    """
+    aggregator = BarAggregatorManager(
+        ("1m", "1h"), "America/New_York", session_start=time(17, 0)
+    )
+    feed_minutes(aggregator, datetime(2025, 3, 9, 5, 0, tzinfo=timezone.utc), 180)
+    aggregator.flush()
+
+    assert len(aggregator.get_bars("1m")) == 180
+    assert get_bar_times(aggregator, "1h") == [
+        "2025-03-09 00:00-0500",
+        "2025-03-09 01:00-0500",
+        "2025-03-09 03:00-0400",
+    ]
+
+
+@pytest.mark.parametrize(
+    "start",
+    [
+        datetime(2025, 1, 10, 22, 0, tzinfo=timezone.utc),
+        datetime(2025, 7, 10, 21, 0, tzinfo=timezone.utc),
+    ],
+    ids=["winter", "summer"],
+)
+def test_bars_are_aligned_to_the_session_start(start: datetime) -> None:
+    """
+    Hourly, four-hour and daily bars open at 17:00 New York time in winter and summer.
+    """
+    aggregator = BarAggregatorManager(
+        ("1h", "4h", "1d"), "America/New_York", session_start=time(17, 0)
+    )
+    feed_minutes(aggregator, start, 2 * 24 * 60)
+    aggregator.flush()
+
+    hours = [bar_time[11:16] for bar_time in get_bar_times(aggregator, "4h")]
+    assert hours[:6] == ["17:00", "21:00", "01:00", "05:00", "09:00", "13:00"]
+    assert get_bar_times(aggregator, "1h")[0][11:16] == "17:00"
+    assert [bar_time[11:16] for bar_time in get_bar_times(aggregator, "1d")] == [
+        "17:00",
+        "17:00",
+    ]
+    assert aggregator.get_bars("1d")["Volume"].tolist() == [1440.0, 1440.0]
+
+
+def test_four_hour_bars_do_not_span_the_fall_back_session() -> None:
+    """
+    The 25-hour session of 2025-11-02 ends with a bar cut at the next session open.
+    """
+    aggregator = BarAggregatorManager(
+        ("4h", "1d"), "America/New_York", session_start=time(17, 0)
+    )
+    feed_minutes(aggregator, datetime(2025, 11, 1, 21, 0, tzinfo=timezone.utc), 26 * 60)
+    aggregator.flush()
+
+    assert get_bar_times(aggregator, "4h") == [
+        "2025-11-01 17:00-0400",
+        "2025-11-01 21:00-0400",
+        "2025-11-02 01:00-0400",
+        "2025-11-02 04:00-0500",
+        "2025-11-02 08:00-0500",
+        "2025-11-02 12:00-0500",
+        "2025-11-02 16:00-0500",
+        "2025-11-02 17:00-0500",
+    ]
+    assert aggregator.get_bars("4h")["Volume"].tolist()[-2:] == [60.0, 60.0]
+    assert aggregator.get_bars("1d")["Volume"].tolist() == [25 * 60.0, 60.0]
+
+
+def test_late_and_out_of_order_ticks() -> None:
+    """
+    A late tick inside the open bar updates its range but not its close, and a tick
+    older than the open bar is dropped.
+    """
+    aggregator = BarAggregatorManager(("1m",))
+    start = datetime(2025, 1, 6, 12, 0, tzinfo=timezone.utc).timestamp()
+
+    aggregator.update_tick(start, 10.0, 1.0)
+    aggregator.update_tick(start + 60, 11.0, 1.0)
+    aggregator.update_tick(start + 90, 12.0, 1.0)
+    aggregator.update_tick(start + 70, 15.0, 1.0)
+    aggregator.update_tick(start + 30, 99.0, 1.0)
+    aggregator.flush()
+
+    bars = aggregator.get_bars("1m")
+    assert bars["Close"].tolist() == [10.0, 12.0]
+    assert bars["High"].tolist() == [10.0, 15.0]
+    assert bars["Volume"].tolist() == [1.0, 3.0]
+
+
+def test_flush_closes_the_open_bars_once() -> None:
+    """
+    Flushing emits the open bar of every timeframe, and flushing again emits nothing.
+    """
+    aggregator = BarAggregatorManager(("1m", "1h"))
+    aggregator.update_bar(
+        datetime(2025, 1, 6, 12, 0),
+        open_price=1.0,
+        high=3.0,
+        low=0.5,
+        close=2.0,
+        volume=4.0,
+    )
+
+    assert aggregator.get_bars("1m").empty
+    aggregator.flush()
+    aggregator.flush()
+
+    for timeframe in ("1m", "1h"):
+        bars = aggregator.get_bars(timeframe)
+        assert bars[["Open", "High", "Low", "Close", "Volume"]].values.tolist() == [
+            [1.0, 3.0, 0.5, 2.0, 4.0]
+        ]
+
+
+def test_subscribers_receive_closed_bars() -> None:
+    """
+    Subscribers are called with every bar closed on their timeframe only.
+    """
+    aggregator = BarAggregatorManager(("1m", "5m"))
+    received: List[BarModel] = []
+    aggregator.subscribe("5m", received.append)
+
+    feed_minutes(aggregator, datetime(2025, 1, 6, 12, 0, tzinfo=timezone.utc), 12)
+    assert [bar["Close"] for bar in received] == [5, 10]
+    assert all(bar["timeframe"] == "5m" for bar in received)
+
+    aggregator.flush()
+    assert [bar["Close"] for bar in received] == [5, 10, 12]
+
+    with pytest.raises(ValueError):
+        aggregator.subscribe("1h", received.append)
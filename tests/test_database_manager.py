@@ -0,0 +1,211 @@
+"""
+tests/test_database_manager.py
+This file checks the streaming, keyset and lookup helpers of DatabaseManager and AsyncDatabaseManager.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from sqlalchemy import select
+
+from domain.entity.article import ArticleEntity
+from infrastructure.async_database_manager import AsyncDatabaseManager
+from infrastructure.database_manager import DatabaseManager
+
+ARTICLE_COUNT = 2500
+
+
+@pytest.fixture(name="database_manager")
+def fixture_database_manager(tmp_path) -> DatabaseManager:
+    """
+    Create a database manager on a temporary SQLite file holding 2500 articles,
+    seven of them sharing each creation time.
+
+    Returns:
+        DatabaseManager: The database manager.
+    """
+    database_manager = DatabaseManager(f"sqlite:///{tmp_path / 'database.db'}")
+    database_manager.engine.echo = False
+    database_manager.upgrade_schema()
+
+    created_at = datetime(2025, 1, 6)
+    with database_manager.get_database_connection() as session:
+        session.add_all(
+            ArticleEntity(
+                id=f"{number:05d}",
+                title=f"title {number}",
+                link=f"link {number}",
+                content="body",
+                created_at=created_at + timedelta(seconds=number // 7),
+            )
+            for number in range(ARTICLE_COUNT)
+        )
+        session.commit()
+    return database_manager
+
+
+@pytest.fixture(name="async_database_manager")
+def fixture_async_database_manager(
+    database_manager: DatabaseManager,
+) -> AsyncDatabaseManager:
+    """
+    Create an asynchronous database manager on the same SQLite file.
+
+    Returns:
+        AsyncDatabaseManager: The asynchronous database manager.
+    """
+    database_url = database_manager.engine.url.set(drivername="sqlite+aiosqlite")
+    async_database_manager = AsyncDatabaseManager(
+        database_url.render_as_string(hide_password=False)
+    )
+    async_database_manager.engine.echo = False
+    return async_database_manager
+
+
+def test_stream_query_yields_chunks_of_the_requested_size(
+    database_manager: DatabaseManager,
+    async_database_manager: AsyncDatabaseManager,
+) -> None:
+    """
+    2500 rows are streamed as chunks of 1000, 1000 and 500, for statements and raw SQL.
+    """
+    statement = select(ArticleEntity.id).order_by(ArticleEntity.id)
+    raw_query = "SELECT id FROM articles ORDER BY id"
+
+    for query in (statement, raw_query):
+        chunks = list(database_manager.stream_query(query, chunk_size=1000))
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+        assert chunks[2][-1].id == f"{ARTICLE_COUNT - 1:05d}"
+
+    async def collect_chunk_sizes() -> List[List[int]]:
+        sizes = []
+        for query in (statement, raw_query):
+            sizes.append(
+                [
+                    len(chunk)
+                    async for chunk in async_database_manager.stream_query(
+                        query, chunk_size=1000
+                    )
+                ]
+            )
+        await async_database_manager.engine.dispose()
+        return sizes
+
+    assert asyncio.run(collect_chunk_sizes()) == [[1000, 1000, 500]] * 2
+
+
+def test_iterate_keyset_covers_every_row_once(
+    database_manager: DatabaseManager,
+    async_database_manager: AsyncDatabaseManager,
+) -> None:
+    """
+    Keyset iteration on (created_at, id) returns every article exactly once, in order,
+    although creation times are shared.
+    """
+    columns = (ArticleEntity.created_at, ArticleEntity.id)
+    expected_ids = [f"{number:05d}" for number in range(ARTICLE_COUNT)]
+
+    pages = list(database_manager.iterate_keyset(columns, page_size=300))
+    assert [len(page) for page in pages] == [300] * 8 + [100]
+    assert [article.id for page in pages for article in page] == expected_ids
+
+    async def collect_ids() -> List[str]:
+        article_ids = [
+            article.id
+            async for page in async_database_manager.iterate_keyset(
+                columns, page_size=300
+            )
+            for article in page
+        ]
+        await async_database_manager.engine.dispose()
+        return article_ids
+
+    assert asyncio.run(collect_ids()) == expected_ids
+
+
+def test_iterate_keyset_rejects_nullable_columns(
+    database_manager: DatabaseManager,
+    async_database_manager: AsyncDatabaseManager,
+) -> None:
+    """
+    A nullable ordering column is rejected before any page is read.
+    """
+    columns = (ArticleEntity.cluster_id, ArticleEntity.id)
+
+    with pytest.raises(ValueError):
+        next(database_manager.iterate_keyset(columns))
+
+    async def read_first_page() -> None:
+        try:
+            await anext(async_database_manager.iterate_keyset(columns))
+        finally:
+            await async_database_manager.engine.dispose()
+
+    with pytest.raises(ValueError):
+        asyncio.run(read_first_page())
+
+
+def test_exists_by_and_get_by(
+    database_manager: DatabaseManager,
+    async_database_manager: AsyncDatabaseManager,
+) -> None:
+    """
+    Lookups by link find stored articles and return nothing for unknown links.
+    """
+    assert database_manager.exists_by(ArticleEntity.link, "link 42")
+    assert not database_manager.exists_by(ArticleEntity.link, "missing")
+    assert database_manager.get_by(ArticleEntity.link, "link 42").title == "title 42"
+    assert database_manager.get_by(ArticleEntity.link, "missing") is None
+
+    async def look_up() -> list:
+        results = [
+            await async_database_manager.exists_by(ArticleEntity.link, "link 42"),
+            await async_database_manager.exists_by(ArticleEntity.link, "missing"),
+            (await async_database_manager.get_by(ArticleEntity.link, "link 42")).title,
+            await async_database_manager.get_by(ArticleEntity.link, "missing"),
+        ]
+        await async_database_manager.engine.dispose()
+        return results
+
+    assert asyncio.run(look_up()) == [True, False, "title 42", None]
+
+
+def test_execute_raw_query_returns_rows_or_nothing(
+    database_manager: DatabaseManager,
+    async_database_manager: AsyncDatabaseManager,
+) -> None:
+    """
+    A SELECT returns rows usable after the session is closed, an UPDATE returns an
+    empty list and is committed.
+    """
+    rows = database_manager.execute_raw_query(
+        "SELECT id, title FROM articles WHERE link = :link", {"link": "link 7"}
+    )
+    assert [(row.id, row.title) for row in rows] == [("00007", "title 7")]
+    assert (
+        database_manager.execute_raw_query(
+            "UPDATE articles SET summary = 'sync' WHERE id = '00007'"
+        )
+        == []
+    )
+
+    async def run_queries() -> list:
+        results = [
+            await async_database_manager.execute_raw_query(
+                "UPDATE articles SET summary = 'async' WHERE id = '00008'"
+            ),
+            await async_database_manager.execute_raw_query(
+                "SELECT id, summary FROM articles WHERE summary IS NOT NULL ORDER BY id"
+            ),
+        ]
+        await async_database_manager.engine.dispose()
+        return results
+
+    update_rows, select_rows = asyncio.run(run_queries())
+    assert update_rows == []
+    assert [(row.id, row.summary) for row in select_rows] == [
+        ("00007", "sync"),
+        ("00008", "async"),
+    ]
@@ -0,0 +1,123 @@
+"""
+tests/test_economic_calendar_feature_manager.py
+This file checks the parsing of economic calendar events and their alignment onto bars.
+"""
+
+import numpy as np
+import pytest
+from pandas import DataFrame, DatetimeIndex, Series, Timestamp, date_range
+
+from infrastructure.economic_calendar_feature_manager import (
+    EconomicCalendarFeatureManager,
+)
+
+
+def make_event(date: str, time: str, currency: str = "USD", **values: str) -> dict:
+    """
+    Build a raw calendar event as returned by investpy.
+
+    Args:
+        date (str): The 'dd/mm/yyyy' date.
+        time (str): The 'HH:MM' time, 'All Day' or 'Tentative'.
+        currency (str): The currency of the event. Defaults to 'USD'.
+        **values (str): The 'importance', 'actual', 'forecast' and 'previous' overrides.
+
+    Returns:
+        dict: The raw event.
+    """
+    event = {
+        "date": date,
+        "time": time,
+        "currency": currency,
+        "importance": "high",
+        "actual": "2.5%",
+        "forecast": "2.0%",
+        "previous": "1.9%",
+    }
+    event.update(values)
+    return event
+
+
+def test_parse_values_handles_units_and_separators() -> None:
+    """
+    Percentages, K/M/B suffixes and thousands separators are parsed, while missing
+    and unparsable values become NaN.
+    """
+    values, is_percent = EconomicCalendarFeatureManager.parse_values(
+        Series(["2.5%", "1.2K", "-0.3M", "1.5B", "1,200", " 4.0 % ", None, "n/a"])
+    )
+
+    np.testing.assert_allclose(values[:6], [2.5, 1200.0, -300000.0, 1.5e9, 1200.0, 4.0])
+    assert np.isnan(values[6:]).all()
+    assert is_percent.tolist() == [True, False, False, False, False, True, False, False]
+
+
+def test_parse_timestamps_handles_all_day_and_ambiguous_times() -> None:
+    """
+    All Day and Tentative events are placed at local midnight, the repeated 01:30 of
+    2025-11-02 in New York is read as standard time, and invalid dates give NaT.
+    """
+    timestamps = EconomicCalendarFeatureManager.parse_timestamps(
+        Series(["02/01/2025", "02/01/2025", "02/01/2025", "02/11/2025", "bad"]),
+        Series(["13:30", "All Day", "Tentative", "01:30", "10:00"]),
+        "America/New_York",
+    )
+
+    assert timestamps[:4].tolist() == [
+        Timestamp("2025-01-02 18:30", tz="UTC"),
+        Timestamp("2025-01-02 05:00", tz="UTC"),
+        Timestamp("2025-01-02 05:00", tz="UTC"),
+        Timestamp("2025-11-02 06:30", tz="UTC"),
+    ]
+    assert timestamps.isna().tolist() == [False, False, False, False, True]
+
+
+def test_align_to_bars_on_a_tz_aware_hourly_index() -> None:
+    """
+    Events are counted on the bar containing them, events outside the bars or of
+    other currencies are ignored.
+    """
+    manager = EconomicCalendarFeatureManager(
+        DataFrame(
+            [
+                make_event("06/01/2025", "08:59"),
+                make_event("06/01/2025", "09:00", importance="low"),
+                make_event("06/01/2025", "09:30"),
+                make_event("06/01/2025", "09:45", currency="EUR"),
+                make_event("06/01/2025", "11:15", importance="medium"),
+                make_event("06/01/2025", "12:00"),
+            ]
+        ),
+        timezone_name="America/New_York",
+    )
+    bar_index = date_range(
+        "2025-01-06 09:00", periods=3, freq="h", tz="America/New_York"
+    )
+
+    features = manager.align_to_bars(bar_index, currencies=["USD"])
+
+    assert features.index.equals(bar_index)
+    assert features["calendar_events"].tolist() == [2, 0, 1]
+    assert features["calendar_high_importance"].tolist() == [1, 0, 0]
+    assert features["calendar_max_importance"].tolist() == [3.0, 0.0, 2.0]
+    np.testing.assert_allclose(
+        features["calendar_weighted_surprise"], [0.25 + 0.75, 0.0, 0.5]
+    )
+
+
+def test_align_to_bars_bounds_a_single_bar() -> None:
+    """
+    A single bar still ignores later events, and its length must be known.
+    """
+    manager = EconomicCalendarFeatureManager(
+        DataFrame(
+            [make_event("06/01/2025", "09:30"), make_event("06/01/2025", "10:30")]
+        )
+    )
+    bar_index = DatetimeIndex([Timestamp("2025-01-06 09:00", tz="UTC")])
+
+    features = manager.align_to_bars(bar_index, bar_length="1h")
+    assert features["calendar_events"].tolist() == [1]
+
+    with pytest.raises(ValueError):
+        manager.align_to_bars(bar_index)
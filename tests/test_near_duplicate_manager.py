@@ -0,0 +1,247 @@
+"""
+tests/test_near_duplicate_manager.py
+This file checks the near-duplicate clustering of articles and the schema upgrade it relies on.
+"""
+
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import inspect, text
+
+from domain.entity.article import ArticleEntity
+from domain.entity.article_lsh_band import ArticleLshBandEntity
+from infrastructure.database_manager import DatabaseManager
+from infrastructure.near_duplicate_manager import NearDuplicateManager
+from infrastructure.news_and_calendar_manager import NewsAndCalendarManager
+
+ECB_STORY = (
+    "The European Central Bank left its three key interest rates unchanged on "
+    "Thursday, as policymakers weighed a steady decline in inflation against signs "
+    "that the euro area economy is losing momentum. President Christine Lagarde told "
+    "reporters that the governing council remained data dependent and would not "
+    "pre-commit to a particular rate path, adding that wage growth was moderating "
+    "but services inflation was still too high. The euro slipped against the dollar "
+    "after the decision, while German bond yields fell to their lowest level in two "
+    "weeks as traders priced in a cut at the next meeting in the autumn."
+)
+EDITED_ECB_STORY = ECB_STORY.replace("two weeks", "three weeks") + " (Reuters)"
+OIL_STORY = (
+    "Oil prices climbed for a third straight session on Tuesday after an industry "
+    "report showed crude inventories in the United States fell more than expected, "
+    "while supply disruptions in the Middle East kept traders cautious. Brent crude "
+    "futures rose to their highest level since April, and analysts said refinery "
+    "demand during the summer driving season should keep stocks tight, supporting "
+    "commodity currencies such as the Canadian and Norwegian crowns."
+)
+
+
+@pytest.fixture(name="database_manager")
+def fixture_database_manager(tmp_path) -> DatabaseManager:
+    """
+    Create a database manager on a temporary SQLite file.
+
+    Returns:
+        DatabaseManager: The database manager.
+    """
+    database_manager = DatabaseManager(f"sqlite:///{tmp_path / 'database.db'}")
+    database_manager.engine.echo = False
+    return database_manager
+
+
+def get_stored_articles(database_manager: DatabaseManager) -> List[ArticleEntity]:
+    """
+    Load the stored articles by link.
+
+    Args:
+        database_manager (DatabaseManager): The database storing the articles.
+
+    Returns:
+        List[ArticleEntity]: The articles ordered by link.
+    """
+    with database_manager.get_database_connection() as session:
+        return session.query(ArticleEntity).order_by(ArticleEntity.link).all()
+
+
+def test_edited_copy_joins_the_original_cluster(
+    database_manager: DatabaseManager,
+) -> None:
+    """
+    A lightly edited copy joins the cluster of the original and loses its content,
+    while an unrelated article starts its own cluster.
+    """
+    manager = NearDuplicateManager(database_manager)
+    original = ArticleEntity(
+        id="original", title="ECB holds", link="a", content=ECB_STORY
+    )
+    copy = ArticleEntity(
+        id="copy", title="ECB holds", link="b", content=EDITED_ECB_STORY
+    )
+    unrelated = ArticleEntity(
+        id="unrelated", title="Oil rises", link="c", content=OIL_STORY
+    )
+    for article in (original, copy, unrelated):
+        manager.add_article(article)
+
+    stored = get_stored_articles(database_manager)
+    assert [(article.id, article.cluster_id) for article in stored] == [
+        ("original", "original"),
+        ("copy", "original"),
+        ("unrelated", "unrelated"),
+    ]
+    assert [article.content for article in stored] == [ECB_STORY, None, OIL_STORY]
+    with database_manager.get_database_connection() as session:
+        assert session.query(ArticleLshBandEntity).count() == 3 * manager.bands
+
+
+def test_load_recent_restores_the_index(database_manager: DatabaseManager) -> None:
+    """
+    A new manager on the same database finds the clusters of the stored articles.
+    """
+    manager = NearDuplicateManager(database_manager)
+    manager.add_article(
+        ArticleEntity(id="original", title="ECB holds", link="a", content=ECB_STORY)
+    )
+    manager.add_article(
+        ArticleEntity(id="unrelated", title="Oil rises", link="c", content=OIL_STORY)
+    )
+
+    restarted = NearDuplicateManager(database_manager)
+    assert list(restarted.recent) == list(manager.recent)
+    assert dict(restarted.buckets) == dict(manager.buckets)
+
+    copy = ArticleEntity(
+        id="copy", title="ECB holds", link="b", content=EDITED_ECB_STORY
+    )
+    restarted.add_article(copy)
+    assert copy.cluster_id == "original"
+    assert copy.content is None
+
+
+def test_backfill_dry_run_commits_nothing(database_manager: DatabaseManager) -> None:
+    """
+    A dry run reports the same reduction as the real backfill without changing
+    the stored articles or the in-memory index.
+    """
+    manager = NearDuplicateManager(database_manager)
+    for article_id, link, content in (
+        ("original", "a", ECB_STORY),
+        ("copy", "b", EDITED_ECB_STORY),
+        ("unrelated", "c", OIL_STORY),
+    ):
+        database_manager.create_to_database(
+            ArticleEntity(id=article_id, title="news", link=link, content=content)
+        )
+
+    report = manager.backfill(dry_run=True)
+    assert (report["articles"], report["clusters"], report["duplicates"]) == (3, 2, 1)
+    assert report["content_chars_after"] == len(ECB_STORY) + len(OIL_STORY)
+    assert not manager.recent
+    assert all(
+        article.minhash is None and article.content
+        for article in get_stored_articles(database_manager)
+    )
+
+    assert manager.backfill() == report
+    assert manager.backfill() == manager.backfill(dry_run=True)
+    assert [article.content for article in get_stored_articles(database_manager)] == [
+        ECB_STORY,
+        None,
+        OIL_STORY,
+    ]
+
+
+def get_schema_and_rows(
+    database_manager: DatabaseManager,
+) -> Tuple[List[Tuple], List[Tuple]]:
+    """
+    Dump the schema and the articles of a SQLite database.
+
+    Args:
+        database_manager (DatabaseManager): The database to dump.
+
+    Returns:
+        Tuple[List[Tuple], List[Tuple]]: The schema objects and the article rows.
+    """
+    with database_manager.engine.connect() as connection:
+        schema = connection.execute(
+            text("SELECT type, name, sql FROM sqlite_master ORDER BY name")
+        ).all()
+        rows = connection.execute(text("SELECT * FROM articles ORDER BY id")).all()
+    return [tuple(row) for row in schema], [tuple(row) for row in rows]
+
+
+def test_upgrade_schema_upgrades_a_baseline_database(
+    database_manager: DatabaseManager,
+) -> None:
+    """
+    A database created before the summary and clustering columns is upgraded in
+    place, and upgrading it again changes nothing.
+    """
+    with database_manager.engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE articles (id VARCHAR(36) NOT NULL PRIMARY KEY, "
+                "title TEXT NOT NULL, link TEXT NOT NULL UNIQUE, content TEXT)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO articles (id, title, link, content) "
+                "VALUES ('old', 'ECB holds', 'a', :content)"
+            ),
+            {"content": ECB_STORY},
+        )
+
+    database_manager.upgrade_schema()
+
+    inspector = inspect(database_manager.engine)
+    assert {column["name"] for column in inspector.get_columns("articles")} == {
+        "id",
+        "title",
+        "link",
+        "content",
+        "summary",
+        "created_at",
+        "cluster_id",
+        "minhash",
+    }
+    assert {index["name"] for index in inspector.get_indexes("articles")} >= {
+        "ix_articles_created_at",
+        "ix_articles_cluster_id",
+    }
+    assert inspector.has_table("article_lsh_bands")
+    (article,) = get_stored_articles(database_manager)
+    assert article.created_at is not None
+    assert article.content == ECB_STORY
+
+    upgraded = get_schema_and_rows(database_manager)
+    database_manager.upgrade_schema()
+    assert get_schema_and_rows(database_manager) == upgraded
+
+
+def test_cluster_representatives_keep_one_article_per_cluster(
+    database_manager: DatabaseManager,
+) -> None:
+    """
+    The context builder keeps one article per cluster, the one holding the content,
+    loading it from the database when only a copy was scraped.
+    """
+    news_manager = NewsAndCalendarManager(database_manager)
+    manager = news_manager.near_duplicate_manager
+    articles = [
+        ArticleEntity(id="ecb", title="ECB holds", link="a", content=ECB_STORY),
+        ArticleEntity(
+            id="ecb-copy", title="ECB holds", link="b", content=EDITED_ECB_STORY
+        ),
+        ArticleEntity(id="oil", title="Oil rises", link="c", content=OIL_STORY),
+        ArticleEntity(id="oil-copy", title="Oil rises", link="d", content=OIL_STORY),
+    ]
+    for article in articles:
+        manager.add_article(article)
+
+    representatives = news_manager.get_cluster_representatives(
+        [articles[1], articles[0], articles[3]]
+    )
+
+    assert [article.id for article in representatives] == ["ecb", "oil"]
+    assert [article.content for article in representatives] == [ECB_STORY, OIL_STORY]
@@ -0,0 +1,169 @@
+"""
+tests/test_summary_manager.py
+This file checks the SummaryManager against a local fake OpenAI compatible endpoint.
+"""
+
+import json
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Iterator, List
+
+import pytest
+
+from domain.entity.article import ArticleEntity
+from infrastructure.database_manager import DatabaseManager
+from infrastructure.model_manager import ModelManager
+from infrastructure.summary_manager import SummaryManager
+
+ARTICLE_TITLE_PATTERN = re.compile(r"^Article \d+: (.*)$", re.MULTILINE)
+
+
+class FakeModelHandler(BaseHTTPRequestHandler):
+    """
+    Answers chat completions with one summary per article, derived from its title.
+    """
+
+    requests: List[List[str]] = []
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """
+        Answer a chat completion request.
+        """
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        titles = ARTICLE_TITLE_PATTERN.findall(body["messages"][-1]["content"])
+        FakeModelHandler.requests.append(titles)
+
+        answer = json.dumps([f"summary of {title}" for title in titles])
+        payload = json.dumps(
+            {
+                "id": "fake",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {
+                            "role": "assistant",
+                            "content": f"```json\n{answer}\n```",
+                        },
+                    }
+                ],
+            }
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+        """
+        Silence the request logs.
+        """
+
+
+@pytest.fixture(name="model_manager")
+def fixture_model_manager(monkeypatch: pytest.MonkeyPatch) -> Iterator[ModelManager]:
+    """
+    Start the fake endpoint and point a ModelManager at it.
+
+    Yields:
+        ModelManager: A model manager using the fake endpoint.
+    """
+    FakeModelHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeModelHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setenv("API_KEY_OPENAI", "fake-key")
+    monkeypatch.setenv(
+        "API_BASE_URL_OPENAI", f"http://127.0.0.1:{server.server_port}/v1"
+    )
+    yield ModelManager()
+
+    server.shutdown()
+
+
+@pytest.fixture(name="database_manager")
+def fixture_database_manager(tmp_path) -> DatabaseManager:
+    """
+    Create a database manager on a temporary SQLite file.
+
+    Returns:
+        DatabaseManager: The database manager.
+    """
+    database_manager = DatabaseManager(f"sqlite:///{tmp_path / 'database.db'}")
+    database_manager.engine.echo = False
+    database_manager.upgrade_schema()
+    return database_manager
+
+
+def test_summaries_are_batched_and_stored(
+    database_manager: DatabaseManager, model_manager: ModelManager
+) -> None:
+    """
+    Seven pending articles are summarized in two calls, each summary on its article.
+    """
+    for number in range(7):
+        database_manager.create_to_database(
+            ArticleEntity(
+                title=f"title {number}", link=f"link {number}", content="body"
+            )
+        )
+    database_manager.create_to_database(
+        ArticleEntity(title="duplicate", link="link duplicate", content=None)
+    )
+
+    summary_manager = SummaryManager(
+        database_manager, model_manager, batch_size=5, batch_timeout=0.1
+    )
+    summary_manager.start()
+    summary_manager.stop()
+
+    assert sorted(len(titles) for titles in FakeModelHandler.requests) == [2, 5]
+    with database_manager.get_database_connection() as session:
+        articles = session.query(ArticleEntity).all()
+    for article in articles:
+        if article.content:
+            assert article.summary == f"summary of {article.title}"
+        else:
+            assert article.summary is None
+
+
+def test_enqueued_articles_are_summarized(
+    database_manager: DatabaseManager, model_manager: ModelManager
+) -> None:
+    """
+    Articles enqueued after the worker started are summarized before it stops.
+    """
+    summary_manager = SummaryManager(database_manager, model_manager, batch_timeout=0.1)
+    summary_manager.start()
+
+    article = ArticleEntity(title="late", link="link late", content="body")
+    database_manager.create_to_database(article)
+    assert summary_manager.enqueue(article.id)
+    summary_manager.stop()
+
+    with database_manager.get_database_connection() as session:
+        assert session.get(ArticleEntity, article.id).summary == "summary of late"
+
+
+def test_start_reports_whether_it_launched_the_worker(
+    database_manager: DatabaseManager, model_manager: ModelManager
+) -> None:
+    """
+    Only the first start launches the worker, and the article pending at that time is
+    summarized once.
+    """
+    article = ArticleEntity(title="first", link="link first", content="body")
+    database_manager.create_to_database(article)
+
+    summary_manager = SummaryManager(database_manager, model_manager, batch_timeout=0.1)
+    assert summary_manager.start()
+    assert not summary_manager.start()
+    summary_manager.stop()
+
+    assert FakeModelHandler.requests == [["first"]]